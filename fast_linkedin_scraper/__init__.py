@@ -1,9 +1,13 @@
 """LinkedIn Scraper Playwright - Playwright-based LinkedIn scraping library."""
 
-from .session import LinkedInSession
-from .auth import PasswordAuth, CookieAuth
-from .browser import BrowserContextManager
-from .config import PersonScrapingFields
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .session import LinkedInSession
+    from .auth import PasswordAuth, CookieAuth
+    from .browser import BrowserContextManager
+    from .config import PersonScrapingFields
 
 __version__ = "2.11.5"
 
@@ -14,3 +18,30 @@ __all__ = [
     "BrowserContextManager",
     "PersonScrapingFields",
 ]
+
+# Public names and the submodules defining them. Every submodule pulls in
+# Playwright, so they're imported on first attribute access (PEP 562) rather
+# than with the package.
+_LAZY_IMPORTS = {
+    "LinkedInSession": ".session",
+    "PasswordAuth": ".auth",
+    "CookieAuth": ".auth",
+    "BrowserContextManager": ".browser",
+    "PersonScrapingFields": ".config",
+}
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,56 @@
+"""Bounded worker pool for running one async job per item."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, TypeVar, Union
+
+T = TypeVar("T", bound=Hashable)
+R = TypeVar("R")
+
+
+async def run_worker_pool(
+    items: Iterable[T],
+    job: Callable[[T], Awaitable[R]],
+    max_workers: int = 5,
+) -> Dict[T, Union[R, Exception]]:
+    """Run job for every item on at most max_workers concurrent workers.
+
+    Workers take items from a shared queue, so a slow item only holds up its
+    own worker. A failing job doesn't stop the others; its exception is
+    returned as that item's result.
+
+    Args:
+        items: Items to process (e.g. profile URLs); duplicates run once
+        job: Coroutine function processing one item
+        max_workers: Maximum number of jobs running at once
+
+    Returns:
+        Result or raised exception per item, in completion order
+    """
+    queue: asyncio.Queue[T] = asyncio.Queue()
+    for item in dict.fromkeys(items):
+        queue.put_nowait(item)
+
+    results: Dict[T, Union[R, Exception]] = {}
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            try:
+                results[item] = await job(item)
+            except Exception as e:
+                results[item] = e
+            finally:
+                queue.task_done()
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(min(max(max_workers, 1), queue.qsize()))
+    ]
+    try:
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    return results
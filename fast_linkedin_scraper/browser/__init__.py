@@ -1,3 +1,3 @@
-from .context import BrowserContextManager
+from .context import BrowserContextManager, close_shared_browsers, get_shared_browser
 
-__all__ = ["BrowserContextManager"]
+__all__ = ["BrowserContextManager", "close_shared_browsers", "get_shared_browser"]
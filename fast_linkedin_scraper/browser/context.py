@@ -1,37 +1,218 @@
 """Simple browser management for LinkedIn scraping."""
 
-from playwright.async_api import BrowserContext, async_playwright
+import asyncio
+import os
+from typing import Optional, Union
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Playwright,
+    StorageState,
+    async_playwright,
+)
 
 from ..config import BrowserConfig
 
+# Browsers shared by every BrowserContextManager(shared_browser=True), one per
+# headless mode, and the Playwright instance driving them. They belong to the
+# event loop that launched them (_shared_loop) and live until
+# close_shared_browsers(); see _claim_shared_state.
+_shared_playwright: Optional[Playwright] = None
+_shared_browsers: dict[bool, Browser] = {}
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_lock: Optional[asyncio.Lock] = None
+
+
+def _claim_shared_state() -> asyncio.Lock:
+    """Tie the shared browser state to the running event loop.
+
+    State left behind by a closed loop (e.g. an earlier asyncio.run) can't be
+    used or closed anymore, so it's dropped and relaunched on demand. Once
+    close_shared_browsers() ran, any loop may take over.
+
+    Returns:
+        Lock guarding the shared state on the running loop
+
+    Raises:
+        RuntimeError: If the shared browsers belong to another loop that is
+            still open
+    """
+    global _shared_playwright, _shared_loop, _shared_lock
+    loop = asyncio.get_running_loop()
+    if _shared_loop is not loop or _shared_lock is None:
+        in_use = _shared_playwright is not None or bool(_shared_browsers)
+        if in_use and _shared_loop is not None and not _shared_loop.is_closed():
+            raise RuntimeError(
+                "Shared browsers belong to another event loop that is still "
+                "open; call close_shared_browsers() on that loop first"
+            )
+        _shared_playwright = None
+        _shared_browsers.clear()
+        _shared_loop = loop
+        _shared_lock = asyncio.Lock()
+    return _shared_lock
+
+
+async def _launch_browser(playwright: Playwright, headless: bool) -> Browser:
+    """Launch Chrome with the standard configuration."""
+    return await playwright.chromium.launch(
+        headless=headless,
+        args=BrowserConfig.CHROME_ARGS,
+        channel="chrome",
+    )
+
+
+async def get_shared_browser(headless: bool = True) -> Browser:
+    """Return the shared browser for a headless mode, launching it on first use.
+
+    Args:
+        headless: Whether the browser runs in headless mode
+
+    Returns:
+        Connected browser shared with other callers of the same mode
+
+    Raises:
+        RuntimeError: If the shared browsers belong to another event loop
+            that is still open
+    """
+    global _shared_playwright
+    async with _claim_shared_state():
+        browser = _shared_browsers.get(headless)
+        if browser is not None and browser.is_connected():
+            return browser
+
+        if _shared_playwright is None:
+            _shared_playwright = await async_playwright().start()
+        browser = await _launch_browser(_shared_playwright, headless)
+        _shared_browsers[headless] = browser
+        return browser
+
+
+async def close_shared_browsers() -> None:
+    """Close all shared browsers and stop the Playwright instance behind them."""
+    global _shared_playwright
+    async with _claim_shared_state():
+        for browser in _shared_browsers.values():
+            try:
+                await browser.close()
+            except Exception:
+                # Already disconnected (e.g. crashed); nothing left to close
+                pass
+        _shared_browsers.clear()
+        if _shared_playwright is not None:
+            await _shared_playwright.stop()
+            _shared_playwright = None
+
 
 class BrowserContextManager:
     """Context manager for browser contexts with automatic cleanup."""
 
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        storage_state: Optional[str] = None,
+        shared_browser: bool = False,
+        user_data_dir: Optional[str] = None,
+    ):
+        """Initialize browser settings.
+
+        Args:
+            headless: Whether to run browser in headless mode
+            storage_state: Path of a saved storage state (cookies, local storage)
+                to restore into the context, if the file exists
+            shared_browser: Open the context in a browser shared across context
+                managers instead of launching one; on exit only the context is
+                closed (see close_shared_browsers)
+            user_data_dir: Browser profile directory to run a persistent context
+                in; cookies and cache survive between runs, so later runs start
+                logged in. Takes precedence over storage_state and shared_browser.
+        """
         self.headless = headless
+        self.storage_state = storage_state
+        self.shared_browser = shared_browser and user_data_dir is None
+        self.user_data_dir = user_data_dir
         self.playwright_context = None
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
 
     async def __aenter__(self) -> BrowserContext:
         """Create and return browser context with standard configuration."""
-        self.playwright_context = async_playwright()
-        playwright = await self.playwright_context.__aenter__()
+        if self.shared_browser:
+            self.browser = await get_shared_browser(self.headless)
+        else:
+            self.playwright_context = async_playwright()
+            self.playwright = await self.playwright_context.__aenter__()
+            if self.user_data_dir is not None:
+                return await self._launch_persistent_context()
+            self.browser = await _launch_browser(self.playwright, self.headless)
+
+        return await self._new_context(
+            self.storage_state
+            if self.storage_state and os.path.exists(self.storage_state)
+            else None
+        )
+
+    async def recycle(self) -> BrowserContext:
+        """Replace the context with a fresh one that keeps its storage state.
 
-        browser = await playwright.chromium.launch(
+        Long-lived contexts keep growing in memory; a new context in the same
+        browser starts clean while cookies and local storage (the login) carry
+        over. Pages of the old context are closed.
+
+        Returns:
+            The new browser context
+        """
+        if self.context is None:
+            raise RuntimeError("No context to recycle; enter the context manager first")
+        if self.user_data_dir is not None:
+            # The profile directory keeps the state; relaunch on the same one
+            await self.context.close()
+            return await self._launch_persistent_context()
+        state = await self.context.storage_state()
+        await self.context.close()
+        return await self._new_context(state)
+
+    async def _launch_persistent_context(self) -> BrowserContext:
+        """Launch Chrome on the profile directory with the standard configuration."""
+        if self.playwright is None or self.user_data_dir is None:
+            raise RuntimeError("No profile directory; enter the context manager first")
+        context = await self.playwright.chromium.launch_persistent_context(
+            self.user_data_dir,
             headless=self.headless,
             args=BrowserConfig.CHROME_ARGS,
             channel="chrome",
+            user_agent=BrowserConfig.USER_AGENT,
+            viewport=BrowserConfig.VIEWPORT,
         )
+        context.set_default_timeout(BrowserConfig.TIMEOUT)
+        self.context = context
+
+        return context
 
-        context = await browser.new_context(
+    async def _new_context(
+        self, storage_state: Union[str, StorageState, None]
+    ) -> BrowserContext:
+        """Open a context with the standard configuration in the browser."""
+        if self.browser is None:
+            raise RuntimeError("No browser; enter the context manager first")
+        context = await self.browser.new_context(
             user_agent=BrowserConfig.USER_AGENT,
             viewport=BrowserConfig.VIEWPORT,
+            storage_state=storage_state,
         )
         context.set_default_timeout(BrowserConfig.TIMEOUT)
+        self.context = context
 
         return context
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Ensure browser and playwright are properly closed."""
-        if self.playwright_context:
+        if self.shared_browser:
+            # Leave the shared browser running for the next context
+            if self.context is not None:
+                await self.context.close()
+                self.context = None
+        elif self.playwright_context:
             await self.playwright_context.__aexit__(exc_type, exc_val, exc_tb)
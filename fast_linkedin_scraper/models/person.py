@@ -88,6 +88,10 @@ class Person(BaseModel):
         """Add an interest entry."""
         self.interests.append(interest)
 
+    def add_interests(self, interests: List[Interest]) -> None:
+        """Add several interest entries at once."""
+        self.interests.extend(interests)
+
     def add_honor(self, honor: Honor) -> None:
         """Add an honor/award entry."""
         self.honors.append(honor)
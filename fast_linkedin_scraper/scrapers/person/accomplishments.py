@@ -1,6 +1,5 @@
 """Accomplishments scraping module for LinkedIn profiles."""
 
-import os
 from typing import Optional
 
 from playwright.async_api import Page, Locator
@@ -42,9 +41,10 @@ async def _scrape_main_profile_accomplishments(page: Page, person: Person) -> No
         try:
             honors_section = page.locator("section:has-text('Honors & awards')").first
             if await honors_section.is_visible():
-                items = await honors_section.locator("li").all()
-                for item in items[:10]:  # Limit to first 10 to avoid too many
-                    honor = await _extract_honor_from_main_profile(item)
+                items = honors_section.locator("li")
+                count = min(await items.count(), 10)  # Limit to first 10
+                for i in range(count):
+                    honor = await _extract_honor_from_main_profile(items.nth(i))
                     if honor:
                         person.add_honor(honor)
         except Exception:
@@ -54,9 +54,10 @@ async def _scrape_main_profile_accomplishments(page: Page, person: Person) -> No
         try:
             languages_section = page.locator("section:has-text('Languages')").first
             if await languages_section.is_visible():
-                items = await languages_section.locator("li").all()
-                for item in items[:10]:  # Limit to first 10
-                    language = await _extract_language_from_main_profile(item)
+                items = languages_section.locator("li")
+                count = min(await items.count(), 10)  # Limit to first 10
+                for i in range(count):
+                    language = await _extract_language_from_main_profile(items.nth(i))
                     if language:
                         # Check if not already added (to avoid duplicates)
                         if not any(
@@ -73,7 +74,8 @@ async def _scrape_main_profile_accomplishments(page: Page, person: Person) -> No
 async def _scrape_honors_details(page: Page, person: Person) -> None:
     """Scrape honors/awards from the details page."""
     try:
-        honors_url = os.path.join(str(person.linkedin_url), "details/honors")
+        base_url = str(person.linkedin_url).rstrip("/")
+        honors_url = f"{base_url}/details/honors"
         await page.goto(honors_url)
         await page.wait_for_timeout(2000)
 
@@ -86,13 +88,14 @@ async def _scrape_honors_details(page: Page, person: Person) -> None:
             return
 
         # Get all list containers
-        list_containers = await main_content.locator(".pvs-list__container").all()
+        list_containers = main_content.locator(".pvs-list__container")
 
-        for list_container in list_containers:
-            items = await list_container.locator(".pvs-list__paged-list-item").all()
+        for c in range(await list_containers.count()):
+            items = list_containers.nth(c).locator(".pvs-list__paged-list-item")
+            count = min(await items.count(), 20)  # Limit to prevent too many
 
-            for item in items[:20]:  # Limit to prevent too many
-                honor = await _extract_honor_from_details(item)
+            for i in range(count):
+                honor = await _extract_honor_from_details(items.nth(i))
                 if honor:
                     # Check if not already added from main profile
                     if not any(h.title == honor.title for h in person.honors):
@@ -105,7 +108,8 @@ async def _scrape_honors_details(page: Page, person: Person) -> None:
 async def _scrape_languages_details(page: Page, person: Person) -> None:
     """Scrape languages from the details page."""
     try:
-        languages_url = os.path.join(str(person.linkedin_url), "details/languages")
+        base_url = str(person.linkedin_url).rstrip("/")
+        languages_url = f"{base_url}/details/languages"
         await page.goto(languages_url)
         await page.wait_for_timeout(2000)
 
@@ -118,13 +122,14 @@ async def _scrape_languages_details(page: Page, person: Person) -> None:
             return
 
         # Get all list containers
-        list_containers = await main_content.locator(".pvs-list__container").all()
+        list_containers = main_content.locator(".pvs-list__container")
 
-        for list_container in list_containers:
-            items = await list_container.locator(".pvs-list__paged-list-item").all()
+        for c in range(await list_containers.count()):
+            items = list_containers.nth(c).locator(".pvs-list__paged-list-item")
+            count = min(await items.count(), 20)  # Limit to prevent too many
 
-            for item in items[:20]:  # Limit to prevent too many
-                language = await _extract_language_from_details(item)
+            for i in range(count):
+                language = await _extract_language_from_details(items.nth(i))
                 if language:
                     # Check if not already added from main profile
                     if not any(lang.name == language.name for lang in person.languages):
@@ -145,24 +150,12 @@ async def _extract_honor_from_main_profile(item: Locator) -> Optional[Honor]:
             return None
 
         # Get issuer and date info
-        issuer = ""
-        date = ""
+        issuer_text = ""
         issuer_elem = item.locator("span:has-text('Issued by')").first
         if await issuer_elem.is_visible():
             issuer_text = await issuer_elem.inner_text()
-            # Parse out institution name from "Issued by X · Date"
-            if "Issued by" in issuer_text:
-                parts = issuer_text.replace("Issued by", "").split("·")
-                if parts:
-                    issuer = parts[0].strip()
-                    if len(parts) > 1:
-                        date = parts[1].strip()
-
-        return Honor(
-            title=title,
-            issuer=issuer if issuer else None,
-            date=date if date else None,
-        )
+
+        return _parse_honor(title, issuer_text)
 
     except Exception:
         return None
@@ -189,52 +182,30 @@ async def _extract_honor_from_details(item: Locator) -> Optional[Honor]:
         if not title:
             return None
 
-        # Get institution
-        issuer = ""
-        date = ""
-        associated_with = ""
-
-        # Try "Issued by" first
+        # Get issuer and date info
+        issuer_text = ""
         issuer_elem = details.locator("span:has-text('Issued by')").first
         if await issuer_elem.is_visible():
             issuer_text = await issuer_elem.inner_text()
-            if "Issued by" in issuer_text:
-                parts = issuer_text.replace("Issued by", "").split("·")
-                if parts:
-                    issuer = parts[0].strip()
-                    if len(parts) > 1:
-                        date = parts[1].strip()
-
-        # Try "Associated with"
+
+        # Get associated organization
+        assoc_text = ""
         assoc_elem = details.locator("span:has-text('Associated with')").first
         if await assoc_elem.is_visible():
             assoc_text = await assoc_elem.inner_text()
-            if "Associated with" in assoc_text:
-                associated_with = assoc_text.replace("Associated with", "").strip()
 
-        # Try to get document URL
+        # Try to get document/media URL (e.g., certificate PDF)
         document_url = None
         try:
-            links = await container.locator("a").all()
-            for link in links:
-                if await link.is_visible():
-                    href = await link.get_attribute("href")
-                    if href:
-                        # Check for document/media links
-                        if "single-media-viewer" in href or "type=DOCUMENT" in href:
-                            # Document/media link (e.g., certificate PDF)
-                            document_url = href
-                            break
+            doc_link = container.locator(
+                "a[href*='single-media-viewer'], a[href*='type=DOCUMENT']"
+            ).first
+            if await doc_link.count():
+                document_url = await doc_link.get_attribute("href")
         except Exception:
             pass
 
-        return Honor(
-            title=title,
-            issuer=issuer if issuer else None,
-            date=date if date else None,
-            associated_with=associated_with if associated_with else None,
-            document_url=HttpUrl(document_url) if document_url else None,
-        )
+        return _parse_honor(title, issuer_text, assoc_text, document_url)
 
     except Exception:
         return None
@@ -247,24 +218,16 @@ async def _extract_language_from_main_profile(item: Locator) -> Optional[Languag
         if not text:
             return None
 
-        # Parse language and proficiency
+        # First line is usually the language name (appears twice)
         lines = text.split("\n")
-        if len(lines) >= 2:
-            # First line is usually the language name (appears twice)
-            language = lines[0].strip()
-            # Look for proficiency level
-            proficiency = ""
-            for line in lines:
-                if "proficiency" in line.lower():
-                    proficiency = line.strip()
-                    break
-
-            if language:
-                return Language(
-                    name=language, proficiency=proficiency if proficiency else None
-                )
+        if len(lines) < 2:
+            return None
 
-        return None
+        # Look for proficiency level
+        proficiency_text = next(
+            (line for line in lines if "proficiency" in line.lower()), ""
+        )
+        return _parse_language(lines[0], proficiency_text)
 
     except Exception:
         return None
@@ -275,22 +238,80 @@ async def _extract_language_from_details(item: Locator) -> Optional[Language]:
     try:
         # Get language name
         name_elem = item.locator("span[aria-hidden='true']").first
-        language = await name_elem.inner_text() if await name_elem.is_visible() else ""
+        name = await name_elem.inner_text() if await name_elem.is_visible() else ""
 
-        if not language:
+        if not name:
             return None
 
         # Get proficiency level
-        proficiency = ""
+        prof_text = ""
         prof_elem = item.locator("span.t-14").first
         if await prof_elem.is_visible():
             prof_text = await prof_elem.inner_text()
-            # Clean up duplicate text that sometimes appears
-            lines = prof_text.split("\n")
-            if lines:
-                proficiency = lines[0].strip()
 
-        return Language(name=language, proficiency=proficiency if proficiency else None)
+        return _parse_language(name, prof_text)
 
     except Exception:
         return None
+
+
+def _parse_honor(
+    title: str,
+    issuer_text: str = "",
+    assoc_text: str = "",
+    document_url: Optional[str] = None,
+) -> Optional[Honor]:
+    """Build an Honor from raw texts read off a main profile or details list item.
+
+    Args:
+        title: Honor title text
+        issuer_text: Text like "Issued by X · Date"
+        assoc_text: Text like "Associated with X"
+        document_url: Link to the certificate/document, if any
+
+    Returns:
+        Honor object or None if there is no title
+    """
+    if not title:
+        return None
+
+    # Parse out institution name and date from "Issued by X · Date"
+    issuer = ""
+    date = ""
+    if "Issued by" in issuer_text:
+        parts = issuer_text.replace("Issued by", "").split("·")
+        issuer = parts[0].strip()
+        if len(parts) > 1:
+            date = parts[1].strip()
+
+    associated_with = ""
+    if "Associated with" in assoc_text:
+        associated_with = assoc_text.replace("Associated with", "").strip()
+
+    return Honor(
+        title=title,
+        issuer=issuer if issuer else None,
+        date=date if date else None,
+        associated_with=associated_with if associated_with else None,
+        document_url=HttpUrl(document_url) if document_url else None,
+    )
+
+
+def _parse_language(name: str, proficiency_text: str = "") -> Optional[Language]:
+    """Build a Language from raw name and proficiency texts.
+
+    Args:
+        name: Language name text
+        proficiency_text: Proficiency text, possibly with duplicated lines
+
+    Returns:
+        Language object or None if there is no name
+    """
+    name = name.strip()
+    if not name:
+        return None
+
+    # Clean up duplicate text that sometimes appears
+    proficiency = proficiency_text.split("\n")[0].strip()
+
+    return Language(name=name, proficiency=proficiency if proficiency else None)
@@ -1,5 +1,16 @@
-"""Connection scraping module for LinkedIn profiles."""
-
+"""Connection scraping module for LinkedIn profiles.
+
+`scrape_connections` navigates to the logged-in user's connections page on
+every call. When scraping many profiles back-to-back, the page passed in
+should come from one long-lived, already authenticated BrowserContext
+(e.g. the one owned by LinkedInSession), ideally restored from a saved
+storage state via `browser.new_context(storage_state=...)` and persisted
+with `await context.storage_state(path=...)` after login. That way the
+cookie validation and login redirects are paid once per process instead
+of once per profile.
+"""
+
+import asyncio
 from typing import Optional
 
 from playwright.async_api import Locator, Page
@@ -36,27 +47,33 @@ async def scrape_connections(page: Page, person: Person) -> None:
             ".mn-connection-card"
         ).all()
 
-        for card in connection_cards:
-            try:
-                connection_data = await _extract_connection_data(card)
-                if connection_data:
-                    connection = Connection(
-                        name=connection_data.get("name", ""),
-                        headline=connection_data.get("occupation", "") or None,
-                        url=HttpUrl(connection_data["url"])
-                        if connection_data.get("url")
-                        else None,
-                    )
-                    person.add_connection(connection)
-            except Exception:
-                # Skip this connection if extraction fails
-                continue
+        # Cards are independent, so extract them concurrently to overlap round-trips
+        results = await asyncio.gather(
+            *(_extract_connection(card) for card in connection_cards),
+            return_exceptions=True,
+        )
+        for connection in results:
+            if isinstance(connection, Connection):
+                person.add_connection(connection)
 
     except Exception:
         # If connections page not accessible or not found, skip connections scraping
         pass
 
 
+async def _extract_connection(card: Locator) -> Optional[Connection]:
+    """Build a Connection from a connection card, or None if extraction fails."""
+    connection_data = await _extract_connection_data(card)
+    if not connection_data:
+        return None
+
+    return Connection(
+        name=connection_data.get("name", ""),
+        headline=connection_data.get("occupation", "") or None,
+        url=HttpUrl(connection_data["url"]) if connection_data.get("url") else None,
+    )
+
+
 async def _extract_connection_data(card: Locator) -> Optional[dict]:
     """Extract connection data from a connection card."""
     try:
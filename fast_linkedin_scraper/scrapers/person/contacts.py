@@ -1,13 +1,120 @@
 """Contacts scraping module for LinkedIn profiles."""
 
 import re
+from functools import lru_cache
 
-from playwright.async_api import Page
+from playwright.async_api import Error as PlaywrightError, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import HttpUrl
 
 from ...models.common import Connection, ContactInfo
 from ...models.person import Person
 from ..company.utils import normalize_profile_url
+from ..utils import scroll_to_bottom
+
+# Patterns for parsing the contact info modal and connection count.
+# All modal fields are matched by one alternation so the text is scanned once.
+# Each field is a zero-width lookahead, so a value (e.g. a website that is a
+# profile link) doesn't consume text another field starts in; the first match
+# per field equals a separate re.search for it.
+_CONTACT_RE = re.compile(
+    r"(?=Email\s*\n\s*(?P<email>[^\n]+))"
+    r"|(?=Website\s*\n\s*(?P<website>[^\n]+))"
+    r"|(?=Phone\s*\n\s*(?P<phone>[^\n]+))"
+    r"|(?=(?P<linkedin>linkedin\.com/in/[^\s]+))"
+)
+_CONTACT_HEADERS = ("Email", "Website", "Phone", "linkedin.com/in/")
+_HTTP_PREFIXES = ("http://", "https://")
+_WEBSITE_PAREN_RE = re.compile(r"\s*\([^)]*\)")
+_CONN_COUNT_RE = re.compile(r"(\d+)\+?\s*connections", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+# URL fragments of pages that list connections
+_CONN_URL_RE = re.compile(
+    r"connections|network-manager/people|search/results/people|mynetwork"
+)
+_HAS_DIGIT_RE = re.compile(r"\d")
+_FOLLOW_RE = re.compile(r"follow", re.IGNORECASE)
+# Common placeholder text around profile links in connection lists
+_SKIP_LINE_RE = re.compile(
+    r"Member's name|Member's occupation|Status is|View|is a mutual connection"
+)
+
+# Connection lists repeat the same /in/ hrefs many times; normalization is pure
+_normalize_profile_url = lru_cache(maxsize=4096)(normalize_profile_url)
+
+_MAX_CONNECTIONS = 20  # Limit to avoid too many (reduced for faster execution)
+
+# In-page extractors: each returns plain data for every candidate in one
+# round-trip instead of several locator calls per card/link. Links resolve
+# their card with closest() rather than a fixed number of parent hops.
+_CONNECTION_CARDS_JS = """() => {
+    const text = (el) => (el ? el.innerText.trim() : "");
+    const cards = document.querySelectorAll(".mn-connection-card");
+    if (cards.length === 0) return null;
+    return Array.from(cards).map((card) => {
+        const link = card.querySelector("a.mn-connection-card__link, a[href*='/in/']");
+        return {
+            href: link ? link.getAttribute("href") : null,
+            name: text(card.querySelector(
+                ".mn-connection-card__name, .update-components-actor__name, .entity-result__title-text a span"
+            )),
+            headline: text(card.querySelector(
+                ".mn-connection-card__occupation, .entity-result__primary-subtitle"
+            )),
+        };
+    });
+}"""
+
+_NETWORK_MANAGER_LINKS_JS = """() => {
+    const text = (el) => (el ? el.innerText.trim() : "");
+    const card = (link) => link.closest(".entity-result, li, .mn-connection-card") || link;
+    return Array.from(document.querySelectorAll("main a[href*='/in/']")).map((link) => {
+        // Headline may be in a nearby subtitle element
+        const container = card(link);
+        return {
+            href: link.getAttribute("href"),
+            name: text(link.querySelector("span[aria-hidden='true']")),
+            linkText: text(link),
+            headline: text(container.querySelector(
+                ".entity-result__primary-subtitle, .t-14.t-normal"
+            )),
+        };
+    });
+}"""
+
+_PROFILE_LINKS_JS = """() => {
+    const text = (el) => (el ? el.innerText.trim() : "");
+    const card = (link) => link.closest(".entity-result, li, .mn-connection-card") || link;
+    // Keep only the first anchor per profile so duplicates never cross the wire
+    const seen = new Set();
+    const out = [];
+    for (const link of document.querySelectorAll("a[href*='/in/']")) {
+        const key = new URL(link.href).pathname.replace(/\\/+$/, "").toLowerCase();
+        if (seen.has(key)) continue;
+        seen.add(key);
+
+        const cardParent = card(link);
+        // Nearby text block for when structured elements are missing
+        let parent = link;
+        let blockText = "";
+        for (let i = 0; i < 3 && parent.parentElement; i++) {
+            parent = parent.parentElement;
+            blockText = parent.innerText || "";
+            if (blockText.length > 10 && blockText.includes("\\n")) break;
+        }
+        out.push({
+            href: link.getAttribute("href"),
+            name: text(cardParent.querySelector(
+                ".mn-connection-card__name, .entity-result__title-text a span, .update-components-actor__name"
+            )),
+            headline: text(cardParent.querySelector(
+                ".mn-connection-card__occupation, .entity-result__primary-subtitle"
+            )),
+            text: blockText,
+        });
+    }
+    return out;
+}"""
 
 
 async def scrape_contacts(page: Page, person: Person) -> None:
@@ -22,23 +129,37 @@ async def scrape_contacts(page: Page, person: Person) -> None:
         page: Playwright page instance
         person: Person model to populate with contacts
     """
+    # Load the profile once; the modal, count and connections link all live on it
+    await _load_profile(page, person)
+
     # First, get contact info from the modal
     await _scrape_contact_info_modal(page, person)
 
     # Get connection count
     await _scrape_connection_count(page, person)
 
+    # The modal overlay would block clicking the connections link
+    await _close_contact_info_modal(page, person)
+
     # Try to get actual connections (only works for own profile)
     await _scrape_connections_list(page, person)
 
 
+async def _load_profile(page: Page, person: Person) -> None:
+    """Navigate to the main profile and wait for the contact info entry point."""
+    try:
+        await page.goto(str(person.linkedin_url), wait_until="domcontentloaded")
+        await page.wait_for_selector(
+            "a[href*='overlay/contact-info'], button:has-text('Contact info')",
+            timeout=4000,
+        )
+    except PlaywrightTimeoutError:
+        pass
+
+
 async def _scrape_contact_info_modal(page: Page, person: Person) -> None:
     """Scrape contact information from the contact info modal."""
     try:
-        # Navigate back to main profile
-        await page.goto(str(person.linkedin_url))
-        await page.wait_for_timeout(2000)
-
         # Find and click contact info button
         contact_button = page.locator("a[href*='overlay/contact-info']").first
         if not await contact_button.is_visible():
@@ -47,7 +168,7 @@ async def _scrape_contact_info_modal(page: Page, person: Person) -> None:
 
         if await contact_button.is_visible():
             await contact_button.click()
-            await page.wait_for_timeout(2000)
+            await page.wait_for_selector(".artdeco-modal__content", timeout=4000)
 
             # Get modal content
             modal = page.locator(".artdeco-modal__content").first
@@ -56,37 +177,40 @@ async def _scrape_contact_info_modal(page: Page, person: Person) -> None:
 
                 contact_info = ContactInfo()
 
+                # Scan the modal text once, keeping the first match per field.
+                # Skip the regex entirely when no field header is present.
+                fields: dict[str, str] = {}
+                if any(header in modal_text for header in _CONTACT_HEADERS):
+                    for match in _CONTACT_RE.finditer(modal_text):
+                        field = match.lastgroup
+                        if field and field not in fields:
+                            fields[field] = match.group(field).strip()
+
                 # Extract email
-                email_match = re.search(r"Email\s*\n\s*([^\n]+)", modal_text)
-                if email_match:
-                    email = email_match.group(1).strip()
-                    if email and "@" in email:
-                        contact_info.email = email
+                email = fields.get("email")
+                if email and "@" in email:
+                    contact_info.email = email
 
                 # Extract website
-                website_match = re.search(r"Website\s*\n\s*([^\n]+)", modal_text)
-                if website_match:
-                    website = website_match.group(1).strip()
+                website = fields.get("website")
+                if website:
                     # Remove any parenthetical info like "(Company)"
-                    website = re.sub(r"\s*\([^)]*\)", "", website).strip()
+                    website = _WEBSITE_PAREN_RE.sub("", website).strip()
                     if website:
                         # Ensure it has a protocol
-                        if not website.startswith(("http://", "https://")):
+                        if not website.startswith(_HTTP_PREFIXES):
                             website = f"https://{website}"
                         contact_info.website = website
 
                 # Extract phone if present
-                phone_match = re.search(r"Phone\s*\n\s*([^\n]+)", modal_text)
-                if phone_match:
-                    phone = phone_match.group(1).strip()
-                    if phone:
-                        contact_info.phone = phone
+                phone = fields.get("phone")
+                if phone:
+                    contact_info.phone = phone
 
                 # Extract LinkedIn URL (usually shown in modal)
-                linkedin_match = re.search(r"linkedin\.com/in/[^\s]+", modal_text)
-                if linkedin_match:
-                    linkedin_url = linkedin_match.group(0)
-                    if not linkedin_url.startswith("http"):
+                linkedin_url = fields.get("linkedin")
+                if linkedin_url:
+                    if not linkedin_url.startswith(_HTTP_PREFIXES):
                         linkedin_url = f"https://{linkedin_url}"
                     contact_info.linkedin_url = linkedin_url
 
@@ -98,12 +222,33 @@ async def _scrape_contact_info_modal(page: Page, person: Person) -> None:
                 close_button = page.locator("button[aria-label*='Dismiss']").first
                 if await close_button.is_visible():
                     await close_button.click()
-                    await page.wait_for_timeout(1000)
+                    await page.wait_for_selector(
+                        ".artdeco-modal__content", state="hidden", timeout=4000
+                    )
 
+    except PlaywrightTimeoutError:
+        return
+    except PlaywrightError:
+        # Page crashed or context closed; let the caller stop early
+        raise
     except Exception:
         pass
 
 
+async def _close_contact_info_modal(page: Page, person: Person) -> None:
+    """Make sure the contact info modal is closed, reloading the profile if needed."""
+    modal = page.locator(".artdeco-modal__content").first
+    try:
+        if not await modal.is_visible():
+            return
+        # The Dismiss button may be missing or the modal slow to close
+        await page.keyboard.press("Escape")
+        await modal.wait_for(state="hidden", timeout=2000)
+    except PlaywrightTimeoutError:
+        # Still open; a fresh load of the profile has no overlay
+        await _load_profile(page, person)
+
+
 async def _scrape_connection_count(page: Page, person: Person) -> None:
     """Extract the connection count from the profile."""
     try:
@@ -112,7 +257,7 @@ async def _scrape_connection_count(page: Page, person: Person) -> None:
         if await connection_elem.is_visible():
             text = await connection_elem.inner_text()
             # Extract number from text like "500+ connections" or "255 connections"
-            match = re.search(r"(\d+)\+?\s*connections", text, re.IGNORECASE)
+            match = _CONN_COUNT_RE.search(text)
             if match:
                 count_str = match.group(1)
                 try:
@@ -120,6 +265,11 @@ async def _scrape_connection_count(page: Page, person: Person) -> None:
                     person.set_connection_count(count)
                 except ValueError:
                     pass
+    except PlaywrightTimeoutError:
+        return
+    except PlaywrightError:
+        # Page crashed or context closed; let the caller stop early
+        raise
     except Exception:
         pass
 
@@ -127,10 +277,6 @@ async def _scrape_connection_count(page: Page, person: Person) -> None:
 async def _scrape_connections_list(page: Page, person: Person) -> None:
     """Scrape connections list (mutual connections or own connections)."""
     try:
-        # First, go back to the profile page
-        await page.goto(str(person.linkedin_url))
-        await page.wait_for_timeout(2000)
-
         # Look for the connections link on the profile (e.g., "452 connections")
         connections_link = None
         navigated_to_connections_page = False
@@ -144,19 +290,17 @@ async def _scrape_connections_list(page: Page, person: Person) -> None:
 
             # If not found or not visible, try other selectors
             if not connections_link or not await connections_link.is_visible():
-                # Try to find any link with "connections" text
-                all_connection_links = await page.locator(
-                    "a:has-text('connections')"
-                ).all()
-                for link in all_connection_links:
-                    if await link.is_visible():
-                        text = await link.inner_text()
-                        # Skip if it's a "follow this page" link
-                        if "follow" not in text.lower():
-                            # Check if it looks like a connection count (e.g., "255 connections")
-                            if any(char.isdigit() for char in text):
-                                connections_link = link
-                                break
+                # Find the first visible link that looks like a connection count
+                # (e.g., "255 connections") and isn't a "follow this page" link
+                link = (
+                    page.locator("a:has-text('connections')")
+                    .filter(
+                        has_text=_HAS_DIGIT_RE, has_not_text=_FOLLOW_RE, visible=True
+                    )
+                    .first
+                )
+                if await link.count():
+                    connections_link = link
         except Exception:
             connections_link = None
 
@@ -181,37 +325,16 @@ async def _scrape_connections_list(page: Page, person: Person) -> None:
                     try:
                         await page.goto("https://www.linkedin.com/mynetwork/")
                         await page.wait_for_timeout(2000)
-                        # Try several ways to click the Connections entry
-                        link_to_connections = None
+                        # Click the first Connections entry point that matches
                         try:
                             link_to_connections = page.locator(
-                                "a[href*='mynetwork/invite-connect/connections']"
+                                "a[href*='mynetwork/invite-connect/connections'], "
+                                "button[aria-label*='Connections' i], "
+                                "button:has-text('Connections'), "
+                                "a:has-text('Connections')"
                             ).first
-                            if (
-                                link_to_connections
-                                and await link_to_connections.is_visible()
-                            ):
+                            if await link_to_connections.count():
                                 await link_to_connections.click()
-                            else:
-                                # Button with label text
-                                btn = page.locator(
-                                    "button[aria-label*='Connections' i]"
-                                ).first
-                                if btn and await btn.is_visible():
-                                    await btn.click()
-                                else:
-                                    # Fallback to text search on buttons/links
-                                    btn2 = page.locator(
-                                        "button:has-text('Connections')"
-                                    ).first
-                                    if btn2 and await btn2.is_visible():
-                                        await btn2.click()
-                                    else:
-                                        a2 = page.locator(
-                                            "a:has-text('Connections')"
-                                        ).first
-                                        if a2 and await a2.is_visible():
-                                            await a2.click()
                         except Exception:
                             pass
                         await page.wait_for_selector(
@@ -229,15 +352,7 @@ async def _scrape_connections_list(page: Page, person: Person) -> None:
         if not navigated_to_connections_page:
             return
         current_url = page.url.lower()
-        if not any(
-            x in current_url
-            for x in [
-                "connections",
-                "network-manager/people",
-                "search/results/people",
-                "mynetwork",
-            ]
-        ):
+        if not _CONN_URL_RE.search(current_url):
             try:
                 await page.goto(
                     "https://www.linkedin.com/mynetwork/network-manager/people/"
@@ -247,229 +362,143 @@ async def _scrape_connections_list(page: Page, person: Person) -> None:
             except Exception:
                 return
 
-        # Scroll to load more connections (reduced for faster execution)
-        for _ in range(2):  # Scroll 2 times to load more
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(1500)
-
-        # If we're on the My Network connections page, parse structured cards
-        if (
-            "mynetwork" in current_url
-            or page.locator(".mn-connection-card").count() > 0
-        ):
+        # Scroll to load more connections until enough are loaded or the
+        # list stops growing
+        previous_count = 0
+        for _ in range(6):
+            await scroll_to_bottom(page)
             try:
-                cards = await page.locator(".mn-connection-card").all()
-                seen_urls = set()
-                connections_added = 0
-                max_connections = 20
-                for card in cards:
-                    if connections_added >= max_connections:
-                        break
-                    try:
-                        link_el = card.locator(
-                            "a.mn-connection-card__link, a[href*='/in/']"
-                        ).first
-                        href = (
-                            await link_el.get_attribute("href")
-                            if link_el and await link_el.is_visible()
-                            else None
-                        )
-                        if not href or "/in/" not in href:
-                            continue
-                        clean_url = normalize_profile_url(href)
-                        if clean_url in seen_urls:
-                            continue
-                        seen_urls.add(clean_url)
-
-                        name = ""
-                        headline = ""
-                        name_el = card.locator(
-                            ".mn-connection-card__name, .update-components-actor__name, .entity-result__title-text a span"
-                        ).first
-                        if name_el and await name_el.is_visible():
-                            name = (await name_el.inner_text()).strip()
-                        headline_el = card.locator(
-                            ".mn-connection-card__occupation, .entity-result__primary-subtitle"
-                        ).first
-                        if headline_el and await headline_el.is_visible():
-                            headline = (await headline_el.inner_text()).strip()
-
-                        if name:
-                            connection = Connection(
-                                name=name,
-                                headline=headline if headline else None,
-                                url=HttpUrl(clean_url),
-                            )
-                            person.add_connection(connection)
-                            connections_added += 1
-                    except Exception:
-                        continue
-                # If we collected any connections, stop here
-                if connections_added > 0:
-                    return
+                await page.wait_for_load_state("networkidle", timeout=1500)
             except Exception:
-                # Fall back to generic parsing
                 pass
+            current_count = await page.locator(
+                ".mn-connection-card, a[href*='/in/']"
+            ).count()
+            if current_count >= _MAX_CONNECTIONS or current_count == previous_count:
+                break
+            previous_count = current_count
+
+        # If the page has My Network connection cards, parse them directly.
+        # The extractor returns null when no cards exist, so the existence
+        # check and the extraction share one traversal.
+        try:
+            cards = await page.evaluate(_CONNECTION_CARDS_JS)
+            if cards:
+                candidates = [
+                    (card["href"], card["name"], card["headline"]) for card in cards
+                ]
+                # If we collected any connections, stop here
+                if _add_connections(person, candidates) > 0:
+                    return
+        except Exception:
+            # Fall back to generic parsing
+            pass
 
         # If we're on the network-manager people page, parse list entries
         if "network-manager/people" in current_url:
             try:
-                seen_urls = set()
-                connections_added = 0
-                max_connections = 20
                 # Items often rendered as entity results with links to profiles
-                items = await page.locator("main a[href*='/in/']").all()
-                for link_el in items:
-                    if connections_added >= max_connections:
-                        break
-                    try:
-                        href = (
-                            await link_el.get_attribute("href")
-                            if link_el and await link_el.is_visible()
-                            else None
-                        )
-                        if not href or "/in/" not in href:
-                            continue
-                        clean_url = normalize_profile_url(href)
-                        if clean_url in seen_urls:
-                            continue
-                        seen_urls.add(clean_url)
-
-                        name = ""
-                        headline = ""
-                        # Try to extract name from accessible text spans near link
-                        name_el = link_el.locator("span[aria-hidden='true']").first
-                        if name_el and await name_el.is_visible():
-                            candidate = (await name_el.inner_text()).strip()
-                            if candidate:
-                                name = candidate
-                        if not name:
-                            candidate = (await link_el.inner_text()).strip()
-                            # Clean excessive whitespace/newlines
-                            candidate = re.sub(r"\s+", " ", candidate)
-                            if 2 <= len(candidate) <= 120:
-                                name = candidate
-
-                        # Headline may be in a nearby subtitle element
-                        container = link_el
-                        for _ in range(4):
-                            container = container.locator("..")
-                        headline_el = container.locator(
-                            ".entity-result__primary-subtitle, .t-14.t-normal"
-                        ).first
-                        if headline_el and await headline_el.is_visible():
-                            headline_candidate = (
-                                await headline_el.inner_text()
-                            ).strip()
-                            if headline_candidate:
-                                headline = headline_candidate
-
-                        if name:
-                            connection = Connection(
-                                name=name,
-                                headline=headline if headline else None,
-                                url=HttpUrl(clean_url),
-                            )
-                            person.add_connection(connection)
-                            connections_added += 1
-                    except Exception:
-                        continue
+                links = await page.evaluate(_NETWORK_MANAGER_LINKS_JS)
+                candidates = []
+                for link in links:
+                    name = link["name"]
+                    if not name:
+                        # Clean excessive whitespace/newlines
+                        candidate = _WS_RE.sub(" ", link["linkText"])
+                        if 2 <= len(candidate) <= 120:
+                            name = candidate
+                    candidates.append((link["href"], name, link["headline"]))
 
-                if connections_added > 0:
+                if _add_connections(person, candidates) > 0:
                     return
             except Exception:
                 pass
 
         # Generic parsing: collect anchors to profiles and infer name/headline
-        connection_links = await page.locator("a[href*='/in/']").all()
+        links = await page.evaluate(_PROFILE_LINKS_JS)
+        candidates = []
+        for link in links:
+            name = link["name"]
+            headline = link["headline"]
+            # Fallback: parse nearby text block if structured elements not found
+            if not name:
+                name, headline = _parse_name_and_headline(link["text"], headline)
+            candidates.append((link["href"], name, headline))
+
+        _add_connections(person, candidates)
+
+    except PlaywrightTimeoutError:
+        return
+    except PlaywrightError:
+        # Page crashed or context closed; let the caller stop early
+        raise
+    except Exception:
+        pass
 
-        # Track unique profiles to avoid duplicates
-        seen_urls = set()
-        connections_added = 0
-        max_connections = 20  # Limit to avoid too many (reduced for faster execution)
 
-        for link in connection_links:
-            if connections_added >= max_connections:
-                break
+def _add_connections(person: Person, candidates: list[tuple[str, str, str]]) -> int:
+    """Add unique connections from (href, name, headline) candidates.
 
-            try:
-                href = await link.get_attribute("href")
-                if not href or "/in/" not in href:
-                    continue
-
-                # Clean URL (remove query parameters)
-                clean_url = normalize_profile_url(href)
-                if clean_url in seen_urls:
-                    continue
-                seen_urls.add(clean_url)
-
-                # Try to extract name and headline from structured elements first
-                name = ""
-                headline = ""
-                try:
-                    card_parent = link
-                    for _ in range(4):
-                        card_parent = card_parent.locator("..")
-                    # Common selectors on connections page
-                    name_el = card_parent.locator(
-                        ".mn-connection-card__name, .entity-result__title-text a span, .update-components-actor__name"
-                    ).first
-                    if name_el and await name_el.is_visible():
-                        candidate = (await name_el.inner_text()).strip()
-                        if candidate:
-                            name = candidate
-                    headline_el = card_parent.locator(
-                        ".mn-connection-card__occupation, .entity-result__primary-subtitle"
-                    ).first
-                    if headline_el and await headline_el.is_visible():
-                        candidate = (await headline_el.inner_text()).strip()
-                        if candidate:
-                            headline = candidate
-                except Exception:
-                    pass
+    Args:
+        person: Person model to populate with connections
+        candidates: Raw profile link data in page order
 
-                # Fallback: parse nearby text block if structured elements not found
-                if not name:
-                    parent = link
-                    for _ in range(3):  # Go up max 3 levels
-                        parent = parent.locator("..")
-                        text = await parent.inner_text()
-                        if len(text) > 10 and "\n" in text:
-                            break
-                    lines = text.split("\n")
-                    # Skip common placeholder text
-                    skip_phrases = [
-                        "Member's name",
-                        "Member's occupation",
-                        "Status is",
-                        "View",
-                        "is a mutual connection",
-                    ]
-                    for line in lines:
-                        line = line.strip()
-                        if not line or any(skip in line for skip in skip_phrases):
-                            continue
-                        if not name and len(line) > 2:
-                            name = line
-                            continue
-                        if name and not headline and len(line) > 5:
-                            if not line.startswith("View ") or not line.endswith(
-                                "'s profile"
-                            ):
-                                headline = line
-                                break
-
-                if name and "/in/" in clean_url:
-                    connection = Connection(
-                        name=name,
-                        headline=headline if headline else None,
-                        url=HttpUrl(clean_url),
-                    )
-                    person.add_connection(connection)
-                    connections_added += 1
+    Returns:
+        Number of connections added
+    """
+    # Track unique profiles to avoid duplicates
+    seen_urls = set()
+    connections_added = 0
 
-            except Exception:
+    for href, name, headline in candidates:
+        if connections_added >= _MAX_CONNECTIONS:
+            break
+
+        try:
+            if not href or "/in/" not in href:
                 continue
 
-    except Exception:
-        pass
+            # Clean URL (remove query parameters)
+            clean_url = _normalize_profile_url(href)
+            if clean_url in seen_urls:
+                continue
+            seen_urls.add(clean_url)
+
+            if name:
+                connection = Connection(
+                    name=name,
+                    headline=headline if headline else None,
+                    url=HttpUrl(clean_url),
+                )
+                person.add_connection(connection)
+                connections_added += 1
+        except Exception:
+            continue
+
+    return connections_added
+
+
+def _parse_name_and_headline(text: str, headline: str = "") -> tuple[str, str]:
+    """Infer name and headline from the text block surrounding a profile link.
+
+    Args:
+        text: Inner text of the nearest ancestor block
+        headline: Headline already found from structured elements, if any
+
+    Returns:
+        Tuple of (name, headline)
+    """
+    name = ""
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or _SKIP_LINE_RE.search(line):
+            continue
+        if not name and len(line) > 2:
+            name = line
+            continue
+        if name and not headline and len(line) > 5:
+            if not line.startswith("View ") or not line.endswith("'s profile"):
+                headline = line
+                break
+
+    return name, headline
@@ -1,13 +1,15 @@
 """Education scraping module for LinkedIn profiles."""
 
-import os
-from typing import Optional
+import logging
+from functools import lru_cache
 
-from playwright.async_api import Page, Locator
+from playwright.async_api import Page
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import HttpUrl
 
 from ...models.person import Person, Education
-from ..utils import scroll_to_half, scroll_to_bottom
+from ..utils import PAGE_READY_JS, scroll_to_half, scroll_to_bottom
 from .utils import (
     clean_single_string_duplicates,
     extract_description_and_skills,
@@ -15,6 +17,41 @@ from .utils import (
     parse_date_range_smart,
 )
 
+logger = logging.getLogger(__name__)
+
+# Walks the education list in the page and returns, per item, the institution
+# URL, the first span text of each summary row and the description text.
+# Returns null when the list is missing; malformed items are dropped in-page.
+_EDUCATION_ITEMS_JS = """() => {
+    const visible = (el) =>
+        !!el && getComputedStyle(el).visibility !== "hidden" && el.getClientRects().length > 0;
+    // Spans are read without a visibility check; missing or empty ones yield ""
+    const text = (el) => (el ? el.innerText.trim() : "");
+
+    const mainList = document.querySelector("main .pvs-list__container");
+    if (!visible(mainList)) return null;
+
+    return Array.from(mainList.querySelectorAll(".pvs-list__paged-list-item")).map((item) => {
+        const container = item.querySelector("div[data-view-name='profile-component-entity']");
+        if (!visible(container)) return null;
+
+        // Main elements - logo and details
+        const [logo, details] = container.children;
+        if (!details) return null;
+
+        const link = logo.firstElementChild;
+        const [summary, summaryText] = details.children;
+        if (!summary) return null;
+
+        const rows = Array.from(summary.querySelectorAll(":scope > * > *"));
+        return {
+            institutionUrl: visible(link) ? link.getAttribute("href") || null : null,
+            spans: rows.map((row) => text(row.querySelector("span"))),
+            summaryText: text(summaryText),
+        };
+    }).filter(Boolean);
+}"""
+
 
 async def scrape_educations(page: Page, person: Person) -> None:
     """Scrape education information from LinkedIn profile.
@@ -24,76 +61,55 @@ async def scrape_educations(page: Page, person: Person) -> None:
         person: Person model to populate with education data
     """
     # Navigate to education details page
-    education_url = os.path.join(str(person.linkedin_url), "details/education")
-    await page.goto(education_url)
+    base_url = str(person.linkedin_url).rstrip("/")
+    education_url = f"{base_url}/details/education"
+    # Skip the reload if we're already there (e.g. on a retry)
+    if page.url.rstrip("/") != education_url:
+        await page.goto(education_url, wait_until="domcontentloaded")
 
-    # Wait for page to load
-    await page.wait_for_timeout(2000)  # 2 seconds
+    # Wait for the education list to render; profiles without one have nothing to scrape
+    try:
+        await page.locator("main .pvs-list__container").first.wait_for(
+            state="visible", timeout=10000
+        )
+    except PlaywrightTimeoutError:
+        return
 
-    # Scroll to ensure all content is loaded
-    await scroll_to_half(page)
-    await page.wait_for_timeout(1000)  # 1 second
-    await scroll_to_bottom(page)
-    await page.wait_for_timeout(2000)  # 2 seconds for content to load
+    # Scroll to ensure all content is loaded, waiting for lazy loading after each
+    for scroll in (scroll_to_half, scroll_to_bottom):
+        await scroll(page)
+        try:
+            await page.wait_for_function(PAGE_READY_JS, timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
 
     # Find the main education container
     try:
-        main_list = page.locator("main .pvs-list__container").first
-        if not await main_list.is_visible():
+        # Read every education item in a single round-trip
+        items = await page.evaluate(_EDUCATION_ITEMS_JS)
+        if items is None:
             return
 
-        # Get all education items
-        education_items = await main_list.locator(".pvs-list__paged-list-item").all()
-
-        for position_elem in education_items:
+        for item in items:
             try:
-                # Find the main education container
-                position_container = position_elem.locator(
-                    "div[data-view-name='profile-component-entity']"
-                ).first
-                if not await position_container.is_visible():
-                    continue
-
-                # Get main elements - logo and details
-                elements = await position_container.locator("> *").all()
-                if len(elements) < 2:
-                    continue
-
-                institution_logo_elem = elements[0]
-                position_details = elements[1]
-
-                # Extract institution LinkedIn URL
-                institution_linkedin_url = await _extract_institution_url(
-                    institution_logo_elem
-                )
-
-                # Extract position details
-                position_details_list = await position_details.locator("> *").all()
-                position_summary_details = (
-                    position_details_list[0] if len(position_details_list) > 0 else None
-                )
-                position_summary_text = (
-                    position_details_list[1] if len(position_details_list) > 1 else None
-                )
-
-                if not position_summary_details:
-                    continue
-
                 # Extract education information
-                education_info = await _extract_education_info(position_summary_details)
+                education_info = _extract_education_info(item["spans"])
+                institution_linkedin_url = item["institutionUrl"]
 
                 # Extract description and skills
                 description = ""
                 skills = []
-                if position_summary_text and await position_summary_text.is_visible():
-                    raw_text = await position_summary_text.inner_text()
-                    # print(f"DEBUG: Education raw text: {repr(raw_text)}")
-                    # Clean single element duplicates before processing
-                    cleaned_text = clean_single_string_duplicates(raw_text)
-                    description, skills = extract_description_and_skills(cleaned_text)
-                    # print(
-                    #     f"DEBUG: Education extracted - description: {repr(description)}, skills: {skills}"
-                    # )
+                if item["summaryText"]:
+                    logger.debug("Education raw text: %r", item["summaryText"])
+                    description, cached_skills = _process_education_text(
+                        item["summaryText"]
+                    )
+                    skills = list(cached_skills)
+                    logger.debug(
+                        "Education extracted - description: %r, skills: %s",
+                        description,
+                        skills,
+                    )
 
                 # Create education object
                 education = Education(
@@ -103,35 +119,61 @@ async def scrape_educations(page: Page, person: Person) -> None:
                     degree=education_info.get("degree") or None,
                     institution_name=education_info.get("institution_name", ""),
                     skills=skills,
-                    linkedin_url=HttpUrl(institution_linkedin_url)
+                    linkedin_url=_to_http_url(institution_linkedin_url)
                     if institution_linkedin_url
                     else None,
                 )
                 person.add_education(education)
 
-            except Exception:
-                # Skip this education if extraction fails
+            except (KeyError, TypeError, ValueError):
+                # Skip this education if its data is malformed or fails validation
                 continue
 
+    except PlaywrightTimeoutError:
+        return
+    except PlaywrightError:
+        # Page crashed or context closed; let the caller stop early
+        raise
     except Exception:
         # If main container not found, skip education scraping
         pass
 
 
-async def _extract_institution_url(institution_logo_elem: Locator) -> Optional[str]:
-    """Extract institution LinkedIn URL from logo element."""
-    try:
-        link_elem = institution_logo_elem.locator("> *").first
-        if await link_elem.is_visible():
-            href = await link_elem.get_attribute("href")
-            return href if href else None
-    except Exception:
-        pass
-    return None
+@lru_cache(maxsize=1024)
+def _to_http_url(url: str) -> HttpUrl:
+    """Validate an institution URL once; the same schools recur across profiles."""
+    return HttpUrl(url)
+
+
+@lru_cache(maxsize=512)
+def _process_education_text(raw_text: str) -> tuple[str, tuple[str, ...]]:
+    """Extract description and skills from an education item's summary text.
+
+    Cached because the same education blocks recur across re-scrapes and
+    classmates' profiles; skills are returned as a tuple so cached results
+    can't be mutated by callers.
+
+    Args:
+        raw_text: Raw summary text of the education item
+
+    Returns:
+        Tuple of (description, skills)
+    """
+    # Clean single element duplicates before processing
+    cleaned_text = clean_single_string_duplicates(raw_text)
+    description, skills = extract_description_and_skills(cleaned_text)
+    return description, tuple(skills)
+
 
+def _extract_education_info(spans: list[str]) -> dict:
+    """Extract education information from the summary span texts.
 
-async def _extract_education_info(position_summary_details: Locator) -> dict:
-    """Extract education information from position summary element."""
+    Args:
+        spans: Texts of the first span in each summary row (empty if missing)
+
+    Returns:
+        Dict with institution_name, degree, from_date and to_date
+    """
     education_info = {
         "institution_name": "",
         "degree": "",
@@ -139,34 +181,27 @@ async def _extract_education_info(position_summary_details: Locator) -> dict:
         "to_date": "",
     }
 
-    try:
-        outer_positions = (
-            await position_summary_details.locator("> *").locator("> *").all()
-        )
-
-        # Extract institution name
-        if len(outer_positions) > 0:
-            institution_span = outer_positions[0].locator("span").first
-            if await institution_span.is_visible():
-                education_info["institution_name"] = await institution_span.inner_text()
-
-        # Intelligently extract degree and dates using regex validation
-        for i in range(1, len(outer_positions)):
-            span = outer_positions[i].locator("span").first
-            if await span.is_visible():
-                text = await span.inner_text()
-
-                # Use regex to check if this text is a date range
-                if is_date_range(text) and not education_info["from_date"]:
-                    # This is the dates field - use smart parser
-                    from_date, to_date = parse_date_range_smart(text)
-                    education_info["from_date"] = from_date
-                    education_info["to_date"] = to_date
-                elif not is_date_range(text) and not education_info["degree"]:
-                    # This is the degree field
-                    education_info["degree"] = text
-
-    except Exception:
-        pass
+    # Extract institution name
+    if len(spans) > 0:
+        education_info["institution_name"] = spans[0]
+
+    # Intelligently extract degree and dates using regex validation
+    for text in spans[1:]:
+        if not text:
+            continue
+
+        # Use regex to check if this text is a date range
+        is_dates = is_date_range(text)
+        if is_dates and not education_info["from_date"]:
+            # This is the dates field - use smart parser
+            from_date, to_date = parse_date_range_smart(text)
+            education_info["from_date"] = from_date
+            education_info["to_date"] = to_date
+        elif not is_dates and not education_info["degree"]:
+            # This is the degree field
+            education_info["degree"] = text
+
+        if education_info["degree"] and education_info["from_date"]:
+            break
 
     return education_info
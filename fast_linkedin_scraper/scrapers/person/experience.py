@@ -1,22 +1,84 @@
 """Experience scraping module for LinkedIn profiles."""
 
-import os
+import logging
+from functools import lru_cache
 from typing import List, Optional
 
-from playwright.async_api import Page, Locator
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import HttpUrl
 
 from ...models.person import Person, Experience
-from ..utils import scroll_to_half, scroll_to_bottom
+from ..utils import PAGE_READY_JS, scroll_to_half, scroll_to_bottom
 from .utils import (
+    DESCRIPTION_TEXTS_JS,
     clean_single_string_duplicates,
-    extract_description_and_skills_from_element,
-    is_date_range,
+    extract_description_and_skills_from_texts,
+    contains_date_range,
     is_employment_type,
     extract_employment_type,
     is_geographic_location,
 )
 
+logger = logging.getLogger(__name__)
+
+# Walks the experience list in the page and returns, per item, the company URL,
+# the first span and full text of each summary element, the description texts
+# and the title, detail and description texts of nested roles. Returns null
+# when the list is missing and null entries for items without the expected
+# structure.
+_EXPERIENCE_ITEMS_JS = (
+    "() => {\n"
+    f"    const descriptionTexts = {DESCRIPTION_TEXTS_JS};\n"
+    """    const visible = (el) =>
+        !!el && getComputedStyle(el).visibility !== "hidden" && el.getClientRects().length > 0;
+    const text = (el) => (el ? el.innerText : "");
+
+    const innerPosition = (inner) => {
+        const link = inner.querySelector("a");
+        if (!visible(link)) return null;
+        const [title, ...rest] = link.children;
+        if (rest.length === 0) return null;
+        return {
+            titleText: visible(title) ? text(title.querySelector("*")) : "",
+            elemTexts: rest.map((el) => (visible(el) ? text(el.querySelector("*")) : "")),
+            description: descriptionTexts(inner),
+        };
+    };
+
+    const mainList = document.querySelector("main .pvs-list__container");
+    if (!visible(mainList)) return null;
+
+    return Array.from(mainList.querySelectorAll(".pvs-list__paged-list-item")).map((item) => {
+        const container = item.querySelector("div[data-view-name='profile-component-entity']");
+        if (!visible(container)) return null;
+
+        // Main elements - logo and details
+        const [logo, details] = container.children;
+        if (!details) return null;
+
+        const link = logo.firstElementChild;
+        const [summary, summaryText] = details.children;
+        if (!summary) return null;
+
+        const outer = Array.from(summary.querySelectorAll(":scope > * > *"));
+        const inner = summaryText
+            ? Array.from(summaryText.querySelectorAll(".pvs-list__container .pvs-list__paged-list-item"))
+            : [];
+        return {
+            companyUrl: visible(link) ? link.getAttribute("href") || null : null,
+            spanTexts: outer.map((el) => text(el.querySelector("span"))),
+            outerTexts: outer.map(text),
+            description: summaryText ? descriptionTexts(summaryText) : null,
+            innerPositions: inner.map(innerPosition),
+        };
+    });
+}"""
+)
+
+# Experience lists this short are rendered in full without scrolling
+_MAX_ITEMS_WITHOUT_SCROLL = 3
+
 
 async def scrape_experiences(page: Page, person: Person) -> None:
     """Scrape experience information from LinkedIn profile.
@@ -26,372 +88,207 @@ async def scrape_experiences(page: Page, person: Person) -> None:
         person: Person model to populate with experiences
     """
     # Navigate to experience details page
-    experience_url = os.path.join(str(person.linkedin_url), "details/experience")
-    await page.goto(experience_url)
-
-    # Wait for page to load
-    await page.wait_for_timeout(2000)  # 2 seconds
+    base_url = str(person.linkedin_url).rstrip("/")
+    experience_url = f"{base_url}/details/experience"
+    await page.goto(experience_url, wait_until="domcontentloaded")
 
-    # Scroll to ensure all content is loaded
-    await scroll_to_half(page)
-    await page.wait_for_timeout(1000)  # 1 second
-    await scroll_to_bottom(page)
-    await page.wait_for_timeout(2000)  # 2 seconds for content to load
+    # Wait for the experience list to render; profiles without one have nothing to scrape
+    main_list = page.locator("main .pvs-list__container").first
+    try:
+        await main_list.wait_for(state="visible", timeout=10000)
+    except PlaywrightTimeoutError:
+        return
+
+    # Short lists are fully rendered up front; only longer ones may lazy-load more
+    # items, and we keep scrolling only while scrolling actually loads some
+    items = main_list.locator(".pvs-list__paged-list-item")
+    count = await items.count()
+    if count > _MAX_ITEMS_WITHOUT_SCROLL:
+        for scroll in (scroll_to_half, scroll_to_bottom):
+            await scroll(page)
+            try:
+                await page.wait_for_function(PAGE_READY_JS, timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
+            new_count = await items.count()
+            if new_count == count:
+                break
+            count = new_count
 
     # Find the main experiences container
     try:
-        main_list = page.locator("main .pvs-list__container").first
-        if not await main_list.is_visible():
+        # Read the texts and URLs of every experience item in a single round-trip
+        raw_items = await page.evaluate(_EXPERIENCE_ITEMS_JS)
+        if raw_items is None:
             return
 
-        # Get all experience items
-        experience_items = await main_list.locator(".pvs-list__paged-list-item").all()
-
-        for position_elem in experience_items:
+        errors: List[tuple[int, str]] = []
+        for index, raw in enumerate(raw_items):
+            # Items without the expected structure come back as null from the page
+            if raw is None:
+                continue
             try:
-                # Find the main position container
-                position_container = position_elem.locator(
-                    "div[data-view-name='profile-component-entity']"
-                ).first
-                if not await position_container.is_visible():
-                    continue
-
-                # Get main elements - logo and details
-                elements = await position_container.locator("> *").all()
-                if len(elements) < 2:
-                    continue
-
-                company_logo_elem = elements[0]
-                position_details = elements[1]
-
-                # Extract company LinkedIn URL
-                company_linkedin_url = await _extract_company_url(company_logo_elem)
-                if not company_linkedin_url:
-                    continue
-
-                # Extract position details
-                position_details_list = await position_details.locator("> *").all()
-                position_summary_details = (
-                    position_details_list[0] if len(position_details_list) > 0 else None
-                )
-                position_summary_text = (
-                    position_details_list[1] if len(position_details_list) > 1 else None
-                )
-
-                if not position_summary_details:
-                    continue
-
-                # Extract outer position information
-                outer_positions = (
-                    await position_summary_details.locator("> *").locator("> *").all()
-                )
-
-                # Parse position information based on number of elements
-                position_info = await _parse_position_info(outer_positions)
-
-                # Check if there are multiple positions within this company
-                inner_positions = await _extract_inner_positions(position_summary_text)
-
-                if len(inner_positions) > 1:
-                    # Handle multiple positions at same company
-                    for inner_position in inner_positions:
-                        experience_data = await _extract_inner_position_data(
-                            inner_position
-                        )
-                        if experience_data:
-                            experience = Experience(
-                                position_title=experience_data.get(
-                                    "position_title", ""
-                                ),
-                                from_date=experience_data.get("from_date", ""),
-                                to_date=experience_data.get("to_date", ""),
-                                duration=experience_data.get("duration"),
-                                location=experience_data.get("location"),
-                                employment_type=experience_data.get("employment_type"),
-                                description=experience_data.get("description", ""),
-                                skills=experience_data.get("skills", []),
-                                institution_name=position_info.get("company", ""),
-                                linkedin_url=HttpUrl(company_linkedin_url)
-                                if company_linkedin_url
-                                else None,
-                            )
-                            person.add_experience(experience)
-                else:
-                    # Single position
-                    (
-                        description,
-                        skills,
-                    ) = await extract_description_and_skills_from_element(
-                        position_summary_text
-                    )
-
-                    experience = Experience(
-                        position_title=position_info.get("position_title", ""),
-                        from_date=position_info.get("from_date", ""),
-                        to_date=position_info.get("to_date", ""),
-                        duration=position_info.get("duration"),
-                        location=position_info.get("location", ""),
-                        employment_type=position_info.get("employment_type"),
-                        description=description,
-                        skills=skills,
-                        institution_name=position_info.get("company", ""),
-                        linkedin_url=HttpUrl(company_linkedin_url)
-                        if company_linkedin_url
-                        else None,
-                    )
-                    person.add_experience(experience)
-
-            except Exception:
-                # Skip this experience if extraction fails
+                experiences = _scrape_experience_item(raw)
+            except Exception as e:
+                # Skip experiences whose extraction failed, but keep track of why
+                errors.append((index, repr(e)))
                 continue
+            for experience in experiences:
+                person.add_experience(experience)
+
+        if errors:
+            logger.warning(
+                "Skipped %d of %d experiences: %r",
+                len(errors),
+                len(raw_items),
+                errors[:3],
+            )
 
     except Exception:
         # If main container not found, skip experience scraping
         pass
 
 
-async def _extract_company_url(company_logo_elem: Locator) -> Optional[str]:
-    """Extract company LinkedIn URL from logo element."""
-    try:
-        link_elem = company_logo_elem.locator("> *").first
-        if await link_elem.is_visible():
-            href = await link_elem.get_attribute("href")
-            return href if href else None
-    except Exception:
-        pass
-    return None
-
-
-async def _parse_position_info(outer_positions: List[Locator]) -> dict:
-    """Parse position information from outer position elements - following Selenium approach."""
-    position_info = {
-        "position_title": "",
-        "company": "",
-        "work_times": "",
-        "location": "",
-        "employment_type": "",
-        "from_date": "",
-        "to_date": "",
-        "duration": None,
-    }
+def _scrape_experience_item(raw: dict) -> List[Experience]:
+    """Build all experiences (one per role) for a single experience list item.
+
+    Args:
+        raw: Texts, URLs and descriptions read for this item by the batched extractor
+
+    Returns:
+        List of experiences for this item
+    """
+    experiences: List[Experience] = []
+
+    # Extract company LinkedIn URL
+    company_linkedin_url = raw["companyUrl"]
+    if not company_linkedin_url:
+        return experiences
+    # Validated once and shared by every role at this company. Every other field
+    # is a string (or list of strings) produced by the parsers below, so the
+    # experiences are built without re-running pydantic validation
+    company_url = HttpUrl(company_linkedin_url)
+
+    # Parse position information based on number of elements
+    position_info = _parse_position_info(raw["spanTexts"], raw["outerTexts"])
+
+    # Check if there are multiple positions within this company
+    inner_positions = raw["innerPositions"]
+
+    if len(inner_positions) > 1:
+        # Handle multiple positions at same company
+        for inner_raw in inner_positions:
+            experience_data = _extract_inner_position_data(inner_raw)
+            if experience_data:
+                experience = Experience.model_construct(
+                    position_title=experience_data.get("position_title", ""),
+                    from_date=experience_data.get("from_date", ""),
+                    to_date=experience_data.get("to_date", ""),
+                    duration=experience_data.get("duration"),
+                    location=experience_data.get("location"),
+                    employment_type=experience_data.get("employment_type"),
+                    description=experience_data.get("description", ""),
+                    skills=experience_data.get("skills", []),
+                    institution_name=position_info.get("company", ""),
+                    linkedin_url=company_url,
+                )
+                experiences.append(experience)
+    else:
+        # Single position
+        description, skills = extract_description_and_skills_from_texts(
+            raw["description"]
+        )
+
+        experience = Experience.model_construct(
+            position_title=position_info.get("position_title", ""),
+            from_date=position_info.get("from_date", ""),
+            to_date=position_info.get("to_date", ""),
+            duration=position_info.get("duration"),
+            location=position_info.get("location", ""),
+            employment_type=position_info.get("employment_type"),
+            description=description,
+            skills=skills,
+            institution_name=position_info.get("company", ""),
+            linkedin_url=company_url,
+        )
+        experiences.append(experience)
+
+    return experiences
+
+
+def _parse_position_info(span_texts: List[str], outer_texts: List[str]) -> dict:
+    """Parse position information from outer position texts - following Selenium approach.
+
+    Args:
+        span_texts: First span text of each outer position element
+        outer_texts: Full text of each outer position element
+
+    Returns:
+        Dict with position title, company, work times, location, employment type and dates
+    """
+    position_title = ""
+    company = ""
+    work_times = ""
+    location = ""
+    employment_type = ""
+    from_date = ""
+    to_date = ""
+    duration = None
 
     try:
         # Follow Selenium logic exactly but with improved field classification
-        if len(outer_positions) == 4:
-            title_text = await outer_positions[0].locator("span").first.inner_text()
-            position_info["position_title"] = clean_single_string_duplicates(title_text)
-            company_text = await outer_positions[1].locator("span").first.inner_text()
-            # Check if company text contains employment type after dot separator
-            if "·" in company_text:
-                company_parts = company_text.split("·")
-                position_info["company"] = company_parts[0].strip()
-                # Check if the part after dot is employment type
-                if len(company_parts) > 1 and is_employment_type(
-                    company_parts[1].strip()
-                ):
-                    position_info["employment_type"] = extract_employment_type(
-                        company_parts[1].strip()
-                    )
-            else:
-                position_info["company"] = company_text
-            position_info["work_times"] = (
-                await outer_positions[2].locator("span").first.inner_text()
-            )
-
-            # Smart classification for the 4th element (could be location or employment type)
-            fourth_element_text = (
-                await outer_positions[3].locator("span").first.inner_text()
+        if len(span_texts) == 4:
+            # Pattern: position_title, company, work_times, location/employment_type
+            position_title = clean_single_string_duplicates(span_texts[0])
+            company, employment_type = _split_company_and_employment(span_texts[1])
+            work_times = span_texts[2]
+            location, employment_type = _classify_trailing(
+                span_texts[3], employment_type
             )
-            if is_employment_type(fourth_element_text):
-                # Only update if we don't already have an employment type from company text
-                if not position_info["employment_type"]:
-                    position_info["employment_type"] = extract_employment_type(
-                        fourth_element_text
-                    )
-                position_info["location"] = ""
-            elif is_geographic_location(fourth_element_text):
-                position_info["location"] = fourth_element_text
-                # Don't clear employment_type if already set from company text
-            else:
-                # Default to location for backward compatibility
-                position_info["location"] = fourth_element_text
-                # Don't clear employment_type if already set from company text
-        elif len(outer_positions) == 3:
+        elif len(span_texts) == 3:
             # Check if second or third element contains work times (has ·, - and year patterns)
-            second_element_text = await outer_positions[1].inner_text()
-            third_element_text = await outer_positions[2].inner_text()
-
-            # Check for date patterns using regex (more accurate than string checks)
             # Experience dates have format like "Oct 2024 - Apr 2025 · 7 mos"
-            is_second_dates = "·" in second_element_text and any(
-                is_date_range(part.strip()) for part in second_element_text.split("·")
-            )
-            is_third_dates = "·" in third_element_text and any(
-                is_date_range(part.strip()) for part in third_element_text.split("·")
-            )
-
-            if is_second_dates:
+            if "·" in outer_texts[1] and contains_date_range(outer_texts[1]):
                 # Pattern: company, work_times, location/employment_type
-                position_info["position_title"] = ""
-                company_text = (
-                    await outer_positions[0].locator("span").first.inner_text()
-                )
-                # Check if company text contains employment type after dot separator
-                if "·" in company_text:
-                    company_parts = company_text.split("·")
-                    position_info["company"] = company_parts[0].strip()
-                    # Check if the part after dot is employment type
-                    if len(company_parts) > 1 and is_employment_type(
-                        company_parts[1].strip()
-                    ):
-                        position_info["employment_type"] = extract_employment_type(
-                            company_parts[1].strip()
-                        )
-                else:
-                    position_info["company"] = company_text
-                position_info["work_times"] = (
-                    await outer_positions[1].locator("span").first.inner_text()
-                )
-
-                # Smart classification for the 3rd element
-                third_element_text = (
-                    await outer_positions[2].locator("span").first.inner_text()
+                company, employment_type = _split_company_and_employment(span_texts[0])
+                work_times = span_texts[1]
+                location, employment_type = _classify_trailing(
+                    span_texts[2], employment_type
                 )
-                if is_employment_type(third_element_text):
-                    # Only update if we don't already have an employment type from company text
-                    if not position_info["employment_type"]:
-                        position_info["employment_type"] = extract_employment_type(
-                            third_element_text
-                        )
-                    position_info["location"] = ""
-                elif is_geographic_location(third_element_text):
-                    position_info["location"] = third_element_text
-                    # Don't clear employment_type if already set from company text
-                else:
-                    # Default to location for backward compatibility
-                    position_info["location"] = third_element_text
-                    # Don't clear employment_type if already set from company text
-            elif is_third_dates:
+            elif "·" in outer_texts[2] and contains_date_range(outer_texts[2]):
                 # Pattern: position_title, company, work_times
-                title_text = await outer_positions[0].locator("span").first.inner_text()
-                position_info["position_title"] = clean_single_string_duplicates(
-                    title_text
-                )
-                company_text = (
-                    await outer_positions[1].locator("span").first.inner_text()
-                )
-                # Check if company text contains employment type after dot separator
-                if "·" in company_text:
-                    company_parts = company_text.split("·")
-                    position_info["company"] = company_parts[0].strip()
-                    # Check if the part after dot is employment type
-                    if len(company_parts) > 1 and is_employment_type(
-                        company_parts[1].strip()
-                    ):
-                        position_info["employment_type"] = extract_employment_type(
-                            company_parts[1].strip()
-                        )
-                else:
-                    position_info["company"] = company_text
-                position_info["work_times"] = (
-                    await outer_positions[2].locator("span").first.inner_text()
-                )
-                position_info["location"] = ""
-                # Don't clear employment_type if already set from company text
+                position_title = clean_single_string_duplicates(span_texts[0])
+                company, employment_type = _split_company_and_employment(span_texts[1])
+                work_times = span_texts[2]
             else:
                 # Fallback: assume no dates, treat as company, unknown, location/employment_type
-                position_info["position_title"] = ""
-                company_text = (
-                    await outer_positions[0].locator("span").first.inner_text()
+                company, employment_type = _split_company_and_employment(span_texts[0])
+                location, employment_type = _classify_trailing(
+                    span_texts[2], employment_type
                 )
-                # Check if company text contains employment type after dot separator
-                if "·" in company_text:
-                    company_parts = company_text.split("·")
-                    position_info["company"] = company_parts[0].strip()
-                    # Check if the part after dot is employment type
-                    if len(company_parts) > 1 and is_employment_type(
-                        company_parts[1].strip()
-                    ):
-                        position_info["employment_type"] = extract_employment_type(
-                            company_parts[1].strip()
-                        )
-                else:
-                    position_info["company"] = company_text
-                position_info["work_times"] = ""
-
-                # Smart classification for the 3rd element
-                third_element_text = (
-                    await outer_positions[2].locator("span").first.inner_text()
-                )
-                if is_employment_type(third_element_text):
-                    # Only update if we don't already have an employment type from company text
-                    if not position_info["employment_type"]:
-                        position_info["employment_type"] = extract_employment_type(
-                            third_element_text
-                        )
-                    position_info["location"] = ""
-                elif is_geographic_location(third_element_text):
-                    position_info["location"] = third_element_text
-                    # Don't clear employment_type if already set from company text
-                else:
-                    # Default to location for backward compatibility
-                    position_info["location"] = third_element_text
-                    # Don't clear employment_type if already set from company text
         else:
             # Default case
-            position_info["position_title"] = ""
-            if len(outer_positions) > 0:
-                company_text = (
-                    await outer_positions[0].locator("span").first.inner_text()
-                )
-                # Check if company text contains employment type after dot separator
-                if "·" in company_text:
-                    company_parts = company_text.split("·")
-                    position_info["company"] = company_parts[0].strip()
-                    # Check if the part after dot is employment type
-                    if len(company_parts) > 1 and is_employment_type(
-                        company_parts[1].strip()
-                    ):
-                        position_info["employment_type"] = extract_employment_type(
-                            company_parts[1].strip()
-                        )
-                else:
-                    position_info["company"] = company_text
-            if len(outer_positions) > 1:
-                position_info["work_times"] = (
-                    await outer_positions[1].locator("span").first.inner_text()
-                )
-            position_info["location"] = ""
-            # Don't clear employment_type if already set from company text
+            if len(span_texts) > 0:
+                company, employment_type = _split_company_and_employment(span_texts[0])
+            if len(span_texts) > 1:
+                work_times = span_texts[1]
 
         # Validate field assignments using regex (more accurate than string checks)
-        if position_info["location"] and "·" in position_info["location"]:
-            # Check if location accidentally contains date ranges
-            if any(
-                is_date_range(part.strip())
-                for part in position_info["location"].split("·")
-            ):
-                # Clear location if it contains date-like content
-                position_info["location"] = ""
-
-        if position_info["work_times"] and "·" in position_info["work_times"]:
-            # Check if work_times contains actual date ranges
-            has_dates = any(
-                is_date_range(part.strip())
-                for part in position_info["work_times"].split("·")
-            )
-            if not has_dates:
-                # Clear work_times if it doesn't contain actual dates
-                position_info["work_times"] = ""
+        if location and "·" in location and contains_date_range(location):
+            # Clear location if it contains date-like content
+            location = ""
+
+        if work_times and "·" in work_times and not contains_date_range(work_times):
+            # Clear work_times if it doesn't contain actual dates
+            work_times = ""
 
         # Parse work times into dates - following Selenium approach
-        if position_info["work_times"]:
-            parts = position_info["work_times"].split("·")
-            times = parts[0].strip() if parts else ""
+        if work_times:
+            # Only the dates and duration parts are needed, so split at most twice
+            parts = work_times.split("·", 2)
+            times = parts[0].strip()
             duration = parts[1].strip() if len(parts) > 1 else None
 
-            position_info["duration"] = duration
-
             # Parse dates from times - handle LinkedIn format properly
             if times:
                 # Handle different date formats:
@@ -400,22 +297,75 @@ async def _parse_position_info(outer_positions: List[Locator]) -> dict:
                 # "2015 -" (ongoing)
                 if " - " in times:
                     date_parts = times.split(" - ")
-                    position_info["from_date"] = date_parts[0].strip()
+                    from_date = date_parts[0].strip()
                     if len(date_parts) > 1 and date_parts[1].strip():
-                        position_info["to_date"] = date_parts[1].strip()
+                        to_date = date_parts[1].strip()
                 elif times.endswith(" -"):
                     # Ongoing position like "2015 -"
-                    position_info["from_date"] = times.replace(" -", "").strip()
+                    from_date = times.replace(" -", "").strip()
                 else:
                     # Fallback for other formats
                     time_parts = times.split()
                     if len(time_parts) >= 2:
-                        position_info["from_date"] = " ".join(time_parts[:2])
+                        from_date = " ".join(time_parts[:2])
 
     except Exception:
         pass
 
-    return position_info
+    return {
+        "position_title": position_title,
+        "company": company,
+        "work_times": work_times,
+        "location": location,
+        "employment_type": employment_type,
+        "from_date": from_date,
+        "to_date": to_date,
+        "duration": duration,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _split_company_and_employment(company_text: str) -> tuple[str, Optional[str]]:
+    """Split company text like "Acme · Full-time" into company and employment type.
+
+    Cached because the same company text repeats across roles and profiles.
+
+    Args:
+        company_text: Company text, optionally followed by "·" and an employment type
+
+    Returns:
+        Tuple of (company, employment_type), employment type "" if there is none
+    """
+    # Check if company text contains employment type after dot separator
+    if "·" not in company_text:
+        return company_text, ""
+
+    company_parts = company_text.split("·")
+    # Check if the part after dot is employment type
+    if len(company_parts) > 1 and is_employment_type(company_parts[1].strip()):
+        return company_parts[0].strip(), extract_employment_type(
+            company_parts[1].strip()
+        )
+    return company_parts[0].strip(), ""
+
+
+def _classify_trailing(
+    text: str, employment_type: Optional[str]
+) -> tuple[str, Optional[str]]:
+    """Classify the trailing element of a position as employment type or location.
+
+    Args:
+        text: Text of the trailing element
+        employment_type: Employment type found so far (e.g. from the company text)
+
+    Returns:
+        Tuple of (location, employment_type)
+    """
+    if is_employment_type(text):
+        # Only update if we don't already have an employment type from company text
+        return "", employment_type or extract_employment_type(text)
+    # Geographic location, or location by default for backward compatibility
+    return text, employment_type
 
 
 def _parse_work_times(work_times: str) -> dict:
@@ -446,75 +396,28 @@ def _parse_work_times(work_times: str) -> dict:
         }
 
 
-async def _extract_clean_description(element: Optional[Locator]) -> str:
-    """Extract clean description text from nested list structure.
+def _extract_inner_position_data(inner_raw: Optional[dict]) -> Optional[dict]:
+    """Extract data from an inner position's texts.
 
     Args:
-        element: The element containing description lists
+        inner_raw: Title, element and description texts read by the batched extractor
 
     Returns:
-        Clean description text without skills or metadata
+        Dict with position fields, or None if the position couldn't be read
     """
-    description, _ = await extract_description_and_skills_from_element(element)
-    return description
-
-
-async def _extract_inner_positions(
-    position_summary_text: Optional[Locator],
-) -> List[Locator]:
-    """Extract inner positions if multiple roles at same company."""
-    inner_positions = []
-
-    if not position_summary_text:
-        return inner_positions
-
     try:
-        # Check if there's a nested list container
-        pvs_containers = await position_summary_text.locator(
-            ".pvs-list__container"
-        ).all()
-        if pvs_containers:
-            for container in pvs_containers:
-                nested_items = await container.locator(
-                    ".pvs-list__paged-list-item"
-                ).all()
-                inner_positions.extend(nested_items)
-    except Exception:
-        pass
-
-    return inner_positions
-
-
-async def _extract_inner_position_data(inner_position: Locator) -> Optional[dict]:
-    """Extract data from inner position element."""
-    try:
-        link_elem = inner_position.locator("a").first
-        if not await link_elem.is_visible():
-            return None
-
-        elements = await link_elem.locator("> *").all()
-        if len(elements) < 2:
+        if not inner_raw:
             return None
 
-        position_title_elem = elements[0]
-
         # Intelligently detect which element contains dates vs location vs employment type
         work_times = ""
         location = ""
         employment_type = ""
 
         # Check elements[1] and elements[2] for date patterns, employment types, and locations
-        for i in range(1, len(elements)):
-            elem_text = (
-                await elements[i].locator("*").first.inner_text()
-                if await elements[i].is_visible()
-                else ""
-            )
-
+        for elem_text in inner_raw["elemTexts"]:
             # Check if this element contains date patterns using regex
-            has_dates = "·" in elem_text and any(
-                is_date_range(part.strip()) for part in elem_text.split("·")
-            )
+            has_dates = "·" in elem_text and contains_date_range(elem_text)
 
             if has_dates and not work_times:
                 work_times = elem_text
@@ -533,19 +436,14 @@ async def _extract_inner_position_data(inner_position: Locator) -> Optional[dict
                     # assign to location (but this shouldn't happen with improved logic)
                     location = elem_text
 
-        title_text = (
-            await position_title_elem.locator("*").first.inner_text()
-            if await position_title_elem.is_visible()
-            else ""
-        )
-        position_title = clean_single_string_duplicates(title_text)
+        position_title = clean_single_string_duplicates(inner_raw["titleText"])
 
         # Parse work times
         times_info = _parse_work_times(work_times)
 
         # Extract description and skills from the inner position structure
-        description, skills = await extract_description_and_skills_from_element(
-            inner_position
+        description, skills = extract_description_and_skills_from_texts(
+            inner_raw["description"]
         )
 
         return {
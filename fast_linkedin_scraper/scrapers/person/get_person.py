@@ -1,169 +1,427 @@
 """Main person profile scraper using Playwright."""
 
-from playwright.async_api import Page
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from playwright.async_api import BrowserContext, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pydantic import HttpUrl
 
 from ...config import PersonScrapingFields
 from ...models.person import Person
+from ..utils import RateLimiter, validate_linkedin_url
 from .accomplishments import scrape_accomplishments
 from .contacts import scrape_contacts
 from .education import scrape_educations
 from .experience import scrape_experiences
 from .interests import scrape_interests
 
+# Detail sections scraped on their own pages: (field, error key, scraper)
+_SECTION_SCRAPERS = [
+    (PersonScrapingFields.EXPERIENCE, "experience", scrape_experiences),
+    (PersonScrapingFields.EDUCATION, "education", scrape_educations),
+    (PersonScrapingFields.INTERESTS, "interests", scrape_interests),
+    (PersonScrapingFields.ACCOMPLISHMENTS, "accomplishments", scrape_accomplishments),
+    (PersonScrapingFields.CONTACTS, "contacts", scrape_contacts),
+]
+
+# Headline candidates in priority order; they should work universally
+_HEADLINE_SELECTORS = [
+    # Direct approach: find h1 then get the next generic element
+    "h1 + div",
+    "h1 ~ div:first-of-type",
+    # Alternative: look in the main profile section
+    ".mt2.relative div:has(h1) + div",
+    # Fallback: find elements that typically contain headlines
+    ".pv-text-details__left-panel > div:nth-child(2)",
+    ".pv-top-card-v2-section-info > div:nth-child(2)",
+]
+
+# Reads the top card of a profile page: name, location, the first match of
+# each headline selector, about text and the profile picture title. Missing
+# elements yield null.
+_BASIC_INFO_JS = """(headlineSelectors) => {
+    const text = (el) => (el ? el.innerText : null);
+    const topPanel = document.querySelector(".mt2.relative");
+    const about = document.querySelector("#about");
+    const picture = document.querySelector(".pv-top-card-profile-picture img");
+    return {
+        name: text(topPanel && topPanel.querySelector("h1")),
+        location: text(document.querySelector(".text-body-small.inline.t-black--light.break-words")),
+        headlines: headlineSelectors.map((selector) => text(document.querySelector(selector))),
+        about: text(about && about.parentElement && about.parentElement.querySelector(".display-flex")),
+        pictureTitle: picture ? picture.getAttribute("title") || "" : null,
+    };
+}"""
+
+# Checks whether a scraped section produced any data: (field, check). A
+# section whose list failed to render (e.g. a throttled load) comes back empty
+# without an error, so such profiles aren't worth caching.
+_SECTION_RESULTS = [
+    (PersonScrapingFields.BASIC_INFO, lambda p: p.name is not None),
+    (PersonScrapingFields.EXPERIENCE, lambda p: bool(p.experiences)),
+    (PersonScrapingFields.EDUCATION, lambda p: bool(p.educations)),
+    (PersonScrapingFields.INTERESTS, lambda p: bool(p.interests)),
+    (PersonScrapingFields.ACCOMPLISHMENTS, lambda p: bool(p.honors or p.languages)),
+    (
+        PersonScrapingFields.CONTACTS,
+        lambda p: (
+            p.contact_info is not None
+            or p.connection_count is not None
+            or bool(p.connections)
+        ),
+    ),
+]
+
+_PROFILE_CACHE_SIZE = 256
+
+# Opens a page for one profile of a batch and closes or returns it afterwards
+PageSource = Callable[[], AsyncContextManager[Page]]
+
 
 class PersonScraper:
     """Scraper for LinkedIn person profiles."""
 
-    def __init__(self, page: Page):
+    def __init__(
+        self, page: Page, max_concurrent_sections: int = 3, cache_ttl: float = 0
+    ):
         """Initialize the scraper with a Playwright page.
 
         Args:
             page: Authenticated Playwright page instance
+            max_concurrent_sections: Maximum number of detail sections scraped at
+                once, each on its own page of the same browser context
+            cache_ttl: Seconds this scraper reuses a scraped profile for the same
+                URL and fields instead of scraping it again (default 0: disabled)
         """
         self.page = page
+        self.max_concurrent_sections = max_concurrent_sections
+        self.cache_ttl = cache_ttl
+        # Recently scraped profiles by (URL, fields): (scrape time, Person),
+        # least recently used first
+        self._profile_cache: OrderedDict[
+            tuple[str, PersonScrapingFields], tuple[float, Person]
+        ] = OrderedDict()
+
+    @classmethod
+    async def scrape_profiles(
+        cls,
+        context: BrowserContext,
+        urls: Sequence[Union[str, HttpUrl]],
+        fields: PersonScrapingFields = PersonScrapingFields.MINIMAL,
+        concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+        page_source: Optional[PageSource] = None,
+        scraper: Optional["PersonScraper"] = None,
+    ) -> List[Person]:
+        """Scrape many LinkedIn person profiles concurrently in one browser context.
+
+        Every profile gets its own page of the shared, already authenticated
+        context, so the login is paid once for the whole batch.
+
+        Args:
+            context: Authenticated browser context to open profile pages in
+            urls: LinkedIn profile URLs, as strings or already validated HttpUrls
+            fields: PersonScrapingFields enum specifying which fields to scrape
+            concurrency: Maximum number of profiles scraped at once
+            rate_limiter: Limits how often a profile scrape may start
+                (default: one per second)
+            page_source: Provides the page for each profile (default: a new
+                page of context, closed afterwards)
+            scraper: Scraper to run every profile on, e.g. to share its profile
+                cache (default: a new scraper per profile, without a cache)
+
+        Returns:
+            Person models in the same order as urls. A profile that couldn't be
+            scraped at all has the error under scraping_errors["profile"].
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(rate=1.0)
+        if page_source is None:
+            page_source = _new_page_source(context)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    cls._scrape_on_page_from(
+                        page_source, scraper, url, fields, semaphore, rate_limiter
+                    )
+                    for url in urls
+                )
+            )
+        )
+
+    @classmethod
+    async def scrape_profiles_as_completed(
+        cls,
+        context: BrowserContext,
+        urls: Sequence[Union[str, HttpUrl]],
+        fields: PersonScrapingFields = PersonScrapingFields.MINIMAL,
+        concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+        page_source: Optional[PageSource] = None,
+        scraper: Optional["PersonScraper"] = None,
+    ) -> AsyncIterator[tuple[Union[str, HttpUrl], Person]]:
+        """Scrape many profiles like scrape_profiles, yielding each as it finishes.
+
+        Slow profiles don't hold back results for fast ones, so callers can
+        process (e.g. save) each profile while the rest are still scraped.
+        Profiles not yet yielded are cancelled if the caller stops iterating.
+
+        Args:
+            context: Authenticated browser context to open profile pages in
+            urls: LinkedIn profile URLs, as strings or already validated HttpUrls
+            fields: PersonScrapingFields enum specifying which fields to scrape
+            concurrency: Maximum number of profiles scraped at once
+            rate_limiter: Limits how often a profile scrape may start
+                (default: one per second)
+            page_source: Provides the page for each profile (default: a new
+                page of context, closed afterwards)
+            scraper: Scraper to run every profile on, e.g. to share its profile
+                cache (default: a new scraper per profile, without a cache)
+
+        Yields:
+            (url, Person) pairs in completion order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(rate=1.0)
+        if page_source is None:
+            page_source = _new_page_source(context)
+
+        async def scrape(
+            url: Union[str, HttpUrl],
+        ) -> tuple[Union[str, HttpUrl], Person]:
+            person = await cls._scrape_on_page_from(
+                page_source, scraper, url, fields, semaphore, rate_limiter
+            )
+            return url, person
+
+        tasks = [asyncio.create_task(scrape(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled scrapes close their pages before the caller moves on
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    async def _scrape_on_page_from(
+        cls,
+        page_source: PageSource,
+        scraper: Optional["PersonScraper"],
+        url: Union[str, HttpUrl],
+        fields: PersonScrapingFields,
+        semaphore: asyncio.Semaphore,
+        rate_limiter: RateLimiter,
+    ) -> Person:
+        """Scrape one profile of a batch on its own page from page_source."""
+        async with semaphore:
+            await rate_limiter.acquire()
+            try:
+                async with page_source() as page:
+                    profile_scraper = scraper if scraper is not None else cls(page)
+                    return await profile_scraper.scrape_profile(url, fields, page=page)
+            except Exception as e:
+                person = Person(linkedin_url=validate_linkedin_url(str(url)))
+                person.scraping_errors["profile"] = str(e)
+                return person
 
     async def scrape_profile(
-        self, url: str, fields: PersonScrapingFields = PersonScrapingFields.MINIMAL
+        self,
+        url: Union[str, HttpUrl],
+        fields: PersonScrapingFields = PersonScrapingFields.MINIMAL,
+        page: Optional[Page] = None,
     ) -> Person:
         """Scrape a LinkedIn person profile.
 
+        The scraper keeps no per-profile state, so one instance can run several
+        scrapes at once as long as each call gets its own page.
+
         Args:
-            url: LinkedIn profile URL as string
+            url: LinkedIn profile URL, as string or already validated HttpUrl
             fields: PersonScrapingFields enum specifying which fields to scrape
+            page: Page to load the profile on (default: the scraper's page);
+                section pages are opened in the same browser context
 
         Returns:
             Person model with scraped data
         """
-        # Validate URL
-        linkedin_url = HttpUrl(url)
+        if page is None:
+            page = self.page
+
+        # Validate URL, unless the caller already did
+        linkedin_url = url if isinstance(url, HttpUrl) else HttpUrl(url)
+
+        # Reuse a recent scrape of the same profile (e.g. a retried batch)
+        cache_key = (str(linkedin_url), fields)
+        if self.cache_ttl > 0:
+            cached = self._get_cached_profile(cache_key)
+            if cached is not None:
+                return cached
 
-        # Navigate to profile
-        await self.page.goto(str(linkedin_url))
+        # Check each requested field once, up front
+        wants_basic_info = PersonScrapingFields.BASIC_INFO in fields
+        wanted_sections = [
+            (name, scrape)
+            for field, name, scrape in _SECTION_SCRAPERS
+            if field in fields
+        ]
 
-        # Wait for initial content to load
-        await self.page.wait_for_timeout(2000)  # 2 seconds
+        # Only basic info is read from the profile page itself; every other
+        # section navigates to its own details page
+        if wants_basic_info:
+            # Navigate to profile
+            await page.goto(str(linkedin_url))
+
+            # Wait for the top card (name) instead of a fixed delay
+            try:
+                await page.wait_for_selector(".mt2.relative h1", timeout=8000)
+            except PlaywrightTimeoutError:
+                # Layout variant without the usual top card; read what's there
+                pass
 
         # Initialize Person model
         person = Person(linkedin_url=linkedin_url)
 
         # Authentication is already handled by the session that passed us the page
 
-        # Always scrape basic information (it's on the main page)
-        if PersonScrapingFields.BASIC_INFO in fields:
+        # Sections live on different URLs and only touch their own Person
+        # fields, so they run concurrently: basic info on the already loaded
+        # profile page, every other section on its own page in the same context
+        semaphore = asyncio.Semaphore(self.max_concurrent_sections)
+
+        async def run_basic_info() -> None:
             try:
-                await self._scrape_basic_info(person)
-                await self.page.wait_for_timeout(1000)  # 1 second between sections
+                await self._scrape_basic_info(page, person)
             except Exception as e:
                 person.scraping_errors["basic_info"] = str(e)
 
-        # Conditionally scrape other fields with error isolation
-        if PersonScrapingFields.EXPERIENCE in fields:
-            try:
-                await scrape_experiences(self.page, person)
-                await self.page.wait_for_timeout(1000)  # 1 second between sections
-            except Exception as e:
-                person.scraping_errors["experience"] = str(e)
+        async def run_section(
+            name: str, scrape: Callable[[Page, Person], Awaitable[None]]
+        ) -> None:
+            async with semaphore:
+                # Resource blocking comes from the context's routes
+                section_page = await page.context.new_page()
+                try:
+                    await scrape(section_page, person)
+                except Exception as e:
+                    person.scraping_errors[name] = str(e)
+                finally:
+                    await section_page.close()
 
-        if PersonScrapingFields.EDUCATION in fields:
-            try:
-                await scrape_educations(self.page, person)
-                await self.page.wait_for_timeout(1000)  # 1 second between sections
-            except Exception as e:
-                person.scraping_errors["education"] = str(e)
+        # Basic information is on the main page; other fields run with error isolation
+        tasks = [run_section(name, scrape) for name, scrape in wanted_sections]
+        if wants_basic_info:
+            tasks.insert(0, run_basic_info())
 
-        if PersonScrapingFields.INTERESTS in fields:
-            try:
-                await scrape_interests(self.page, person)
-                await self.page.wait_for_timeout(1000)  # 1 second between sections
-            except Exception as e:
-                person.scraping_errors["interests"] = str(e)
+        await asyncio.gather(*tasks)
 
-        if PersonScrapingFields.ACCOMPLISHMENTS in fields:
-            try:
-                await scrape_accomplishments(self.page, person)
-                await self.page.wait_for_timeout(1000)  # 1 second between sections
-            except Exception as e:
-                person.scraping_errors["accomplishments"] = str(e)
-
-        if PersonScrapingFields.CONTACTS in fields:
-            try:
-                await scrape_contacts(self.page, person)
-                await self.page.wait_for_timeout(1000)  # 1 second between sections
-            except Exception as e:
-                person.scraping_errors["contacts"] = str(e)
+        # Only complete scrapes are worth reusing
+        if (
+            self.cache_ttl > 0
+            and not person.scraping_errors
+            and _has_all_sections(person, fields)
+        ):
+            self._cache_profile(cache_key, person)
 
         return person
 
-    async def _scrape_basic_info(self, person: Person) -> None:
+    async def _scrape_basic_info(self, page: Page, person: Person) -> None:
         """Scrape basic profile information (name, location, about)."""
-        # Get name and location
+        # Read every top card field in a single round-trip
         try:
-            top_panel = self.page.locator(".mt2.relative").first
-            name_element = top_panel.locator("h1").first
-            if await name_element.is_visible():
-                person.name = await name_element.inner_text()
+            info = await page.evaluate(_BASIC_INFO_JS, _HEADLINE_SELECTORS)
         except Exception:
-            pass
+            person.open_to_work = False
+            return
 
-        try:
-            location_element = self.page.locator(
-                ".text-body-small.inline.t-black--light.break-words"
-            ).first
-            if await location_element.is_visible():
-                person.add_location(await location_element.inner_text())
-        except Exception:
-            pass
+        # Get name and location
+        if info["name"] is not None:
+            person.name = info["name"]
+        if info["location"] is not None:
+            person.add_location(info["location"])
 
-        # Get headline - simplified approach based on DOM structure
-        try:
-            # From MCP DOM analysis, the headline appears right after the name
-            # Try multiple selectors that should work universally
-            headline_selectors = [
-                # Direct approach: find h1 then get the next generic element
-                "h1 + div",
-                "h1 ~ div:first-of-type",
-                # Alternative: look in the main profile section
-                ".mt2.relative div:has(h1) + div",
-                # Fallback: find elements that typically contain headlines
-                ".pv-text-details__left-panel > div:nth-child(2)",
-                ".pv-top-card-v2-section-info > div:nth-child(2)",
-            ]
-
-            for selector in headline_selectors:
-                headline_element = self.page.locator(selector).first
-                if await headline_element.is_visible():
-                    headline_text = (await headline_element.inner_text()).strip()
-                    # Make sure it's not the name and has substantial content
-                    if (
-                        headline_text
-                        and headline_text != person.name
-                        and len(headline_text) > 5
-                        and headline_text not in ["", "null", "undefined"]
-                    ):
-                        person.add_headline(headline_text)
-                        break
-        except Exception:
-            pass
+        # Get headline - simplified approach based on DOM structure.
+        # From MCP DOM analysis, the headline appears right after the name; keep
+        # the first candidate, in priority order, that looks like a headline
+        for headline_text in info["headlines"]:
+            if headline_text is not None:
+                headline_text = headline_text.strip()
+                # Make sure it's not the name and has substantial content
+                if (
+                    headline_text
+                    and headline_text != person.name
+                    and len(headline_text) > 5
+                    and headline_text not in ["", "null", "undefined"]
+                ):
+                    person.add_headline(headline_text)
+                    break
 
         # Get about section - following Selenium approach exactly
-        try:
-            about = (
-                self.page.locator("#about").locator("..").locator(".display-flex").first
-            )
-            if await about.is_visible():
-                about_text = await about.inner_text()
-                person.add_about(about_text)
-        except Exception:
-            pass
+        if info["about"] is not None:
+            person.add_about(info["about"])
 
         # Check if open to work
+        if info["pictureTitle"] is not None:
+            person.open_to_work = "#OPEN_TO_WORK" in info["pictureTitle"]
+
+    def _get_cached_profile(
+        self, key: tuple[str, PersonScrapingFields]
+    ) -> Optional[Person]:
+        """Return a copy of a cached profile scraped less than cache_ttl seconds ago."""
+        cached = self._profile_cache.get(key)
+        if cached is None:
+            return None
+        scraped_at, person = cached
+        if time.monotonic() - scraped_at >= self.cache_ttl:
+            del self._profile_cache[key]
+            return None
+        self._profile_cache.move_to_end(key)
+        # Copies keep callers from mutating the cached profile
+        return person.model_copy(deep=True)
+
+    def _cache_profile(
+        self, key: tuple[str, PersonScrapingFields], person: Person
+    ) -> None:
+        """Cache a copy of a scraped profile, evicting the least recently used."""
+        self._profile_cache[key] = (time.monotonic(), person.model_copy(deep=True))
+        self._profile_cache.move_to_end(key)
+        while len(self._profile_cache) > _PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
+
+
+def _has_all_sections(person: Person, fields: PersonScrapingFields) -> bool:
+    """Check that every requested section produced some data."""
+    return all(
+        has_data(person) for field, has_data in _SECTION_RESULTS if field in fields
+    )
+
+
+def _new_page_source(context: BrowserContext) -> PageSource:
+    """Create a page source opening a new page of context, closed after use."""
+
+    @asynccontextmanager
+    async def new_page() -> AsyncIterator[Page]:
+        page = await context.new_page()
         try:
-            profile_picture = self.page.locator(
-                ".pv-top-card-profile-picture img"
-            ).first
-            if await profile_picture.is_visible():
-                title_attr = await profile_picture.get_attribute("title")
-                person.open_to_work = title_attr and "#OPEN_TO_WORK" in title_attr
-        except Exception:
-            person.open_to_work = False
+            yield page
+        finally:
+            await page.close()
+
+    return new_page
@@ -1,12 +1,66 @@
 """Interests scraping module for LinkedIn profiles."""
 
-import os
+import re
 from typing import Optional
 
-from playwright.async_api import Page, Locator
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ...models.person import Person, Interest
-from ..utils import scroll_to_half, scroll_to_bottom
+from ..utils import scroll_to_end
+
+# Walks every interest list in the page and returns, per item with a visible
+# link, the link URL, its image alt text, aria-label and aria-hidden span text,
+# and the item's visible text. Returns null when main is missing.
+_INTEREST_ITEMS_JS = """() => {
+    const visible = (el) =>
+        !!el && getComputedStyle(el).visibility !== "hidden" && el.getClientRects().length > 0;
+
+    const main = document.querySelector("main");
+    if (!visible(main)) return null;
+
+    const items = main.querySelectorAll(".pvs-list__container .pvs-list__paged-list-item");
+    return Array.from(items).flatMap((item) => {
+        // Try to find the main link in the item
+        const link = item.querySelector("a");
+        if (!visible(link)) return [];
+
+        const img = link.querySelector("img");
+        const nameSpan = link.querySelector("span[aria-hidden='true']");
+        return [{
+            url: link.getAttribute("href"),
+            imgAlt: visible(img) ? img.getAttribute("alt") : null,
+            ariaLabel: link.getAttribute("aria-label"),
+            nameText: visible(nameSpan) ? nameSpan.innerText : null,
+            itemText: item.innerText,
+        }];
+    });
+}"""
+
+# True once the number of list items has been the same for two polls in a row.
+# State is kept on window since the predicate is re-run on every poll.
+_LIST_SETTLED_JS = """() => {
+    const count = document.querySelectorAll(".pvs-list__paged-list-item").length;
+    if (window.__interestsItemCount === count) {
+        window.__interestsStablePolls = (window.__interestsStablePolls || 0) + 1;
+    } else {
+        window.__interestsItemCount = count;
+        window.__interestsStablePolls = 0;
+    }
+    return window.__interestsStablePolls >= 2;
+}"""
+
+# Follower count like "1,029,906 followers" or "1.2M followers"
+_FOLLOWERS_RE = re.compile(r"(\d[\d.,]*[KMB]?)\s+followers?\b", re.IGNORECASE)
+
+# Interest type by URL path segment
+_INTEREST_TYPES = {
+    "in": "influencer",
+    "company": "company",
+    "groups": "group",
+    "newsletters": "newsletter",
+    "school": "school",
+}
 
 
 async def scrape_interests(page: Page, person: Person) -> None:
@@ -17,131 +71,91 @@ async def scrape_interests(page: Page, person: Person) -> None:
         person: Person model to populate with interests
     """
     # Navigate to interests details page
-    interests_url = os.path.join(str(person.linkedin_url), "details/interests")
+    base_url = str(person.linkedin_url).rstrip("/")
+    interests_url = f"{base_url}/details/interests"
     await page.goto(interests_url)
 
-    # Wait for page to load
-    await page.wait_for_timeout(2000)  # 2 seconds
+    # Wait for the main content instead of a fixed delay
+    try:
+        await page.wait_for_selector("main", timeout=8000)
+    except PlaywrightTimeoutError:
+        return
 
-    # Scroll to ensure all content is loaded
-    await scroll_to_half(page)
-    await page.wait_for_timeout(1000)  # 1 second
-    await scroll_to_bottom(page)
-    await page.wait_for_timeout(2000)  # 2 seconds for content to load
+    # Scroll until the page stops growing, then wait until the item count settles
+    await scroll_to_end(page)
+    try:
+        await page.wait_for_function(_LIST_SETTLED_JS, polling=250, timeout=5000)
+    except PlaywrightTimeoutError:
+        pass
 
     # Find the main interests container
     try:
-        main_content = page.locator("main").first
-        if not await main_content.is_visible():
+        # Read every interest item of every category in a single round-trip
+        raw_items = await page.evaluate(_INTEREST_ITEMS_JS)
+        if raw_items is None:
             return
 
-        # Get all list containers (different categories of interests)
-        list_containers = await main_content.locator(".pvs-list__container").all()
-
-        for list_container in list_containers:
-            # Get all items in this list
-            items = await list_container.locator(".pvs-list__paged-list-item").all()
-
-            for item in items:
-                try:
-                    interest = await _extract_interest_from_item(item)
-                    if interest:
-                        person.add_interest(interest)
-                except Exception:
-                    # Skip this interest if extraction fails
-                    continue
+        interests = []
+        for raw in raw_items:
+            try:
+                interest = _extract_interest_from_item(raw)
+                if interest:
+                    interests.append(interest)
+            except Exception:
+                # Skip this interest if extraction fails
+                continue
+        person.add_interests(interests)
 
     except Exception:
         # If main container not found, skip interests scraping
         pass
 
 
-async def _extract_interest_from_item(item: Locator) -> Optional[Interest]:
-    """Extract interest information from a list item.
+def _extract_interest_from_item(raw: dict) -> Optional[Interest]:
+    """Extract interest information from a list item's texts.
 
     Args:
-        item: The list item locator containing interest information
+        raw: Link URL, image alt, aria-label and span texts read by the batched extractor
 
     Returns:
         Interest object or None if extraction fails
     """
-    try:
-        # Try to find the main link in the item
-        link = item.locator("a").first
-        if not await link.is_visible():
-            return None
-
-        # Get the URL
-        url = link.get_attribute("href")
-        if not url:
-            return None
-
-        # Determine the type and extract name based on URL pattern
-        interest_type = "unknown"
-        name = ""
-
-        if "/in/" in url:
-            # This is a person/influencer
-            interest_type = "influencer"
-            # Try to extract name from image alt text or link text
-            img = link.locator("img").first
-            if await img.is_visible():
-                name = await img.get_attribute("alt") or ""
-            if not name:
-                # Try to get from span with aria-hidden
-                name_elem = link.locator("span[aria-hidden='true']").first
-                if await name_elem.is_visible():
-                    name = (await name_elem.inner_text()).strip()
-        elif "/company/" in url:
-            # This is a company
-            interest_type = "company"
-            # Try to get company name from aria-label
-            aria_label = await link.get_attribute("aria-label")
-            if aria_label and "company page for" in aria_label.lower():
-                name = aria_label.replace("Company page for", "").strip()
-            else:
-                # Try from image alt text
-                img = link.locator("img").first
-                if await img.is_visible():
-                    name = await img.get_attribute("alt") or ""
-        elif "/groups/" in url:
-            # This is a group
-            interest_type = "group"
-            # Extract group name from link text or image
-            img = link.locator("img").first
-            if await img.is_visible():
-                name = await img.get_attribute("alt") or ""
-        elif "/newsletters/" in url:
-            # This is a newsletter
-            interest_type = "newsletter"
-            # Extract newsletter name
-            img = link.locator("img").first
-            if await img.is_visible():
-                name = await img.get_attribute("alt") or ""
-        elif "/school/" in url:
-            # This is a school
-            interest_type = "school"
-            # Extract school name
-            img = link.locator("img").first
-            if await img.is_visible():
-                name = await img.get_attribute("alt") or ""
-
-        # If we couldn't extract a name, skip this item
-        if not name:
-            return None
-
-        # Extract follower count if available
-        followers = None
-        try:
-            follower_elem = item.locator("span:has-text('followers')").first
-            if await follower_elem.is_visible():
-                followers_text = await follower_elem.inner_text()
-                # Extract number from text like "1,029,906 followers"
-                followers = followers_text.split(" ")[0].replace(",", "")
-        except Exception:
-            pass
-
-        return Interest(name=name, type=interest_type, url=url, followers=followers)
+    # Get the URL
+    url = raw["url"]
+    if not url:
+        return None
 
-    except Exception:
+    # Determine the type from the first known URL path segment, e.g. /company/
+    interest_type = next(
+        (_INTEREST_TYPES[part] for part in url.split("/") if part in _INTEREST_TYPES),
+        "unknown",
+    )
+
+    # Extract the name; image alt text works for every type
+    name = ""
+    aria_label = raw["ariaLabel"]
+    if interest_type == "influencer":
+        # Try to extract name from image alt text, then the span with aria-hidden
+        name = raw["imgAlt"] or (raw["nameText"] or "").strip()
+    elif (
+        interest_type == "company"
+        and aria_label
+        and "company page for" in aria_label.lower()
+    ):
+        # Try to get company name from aria-label
+        name = aria_label.replace("Company page for", "").strip()
+    elif interest_type != "unknown":
+        name = raw["imgAlt"] or ""
+
+    # If we couldn't extract a name, skip this item
+    if not name:
         return None
+
+    # Extract follower count if available, from text like "1,029,906 followers"
+    followers_match = _FOLLOWERS_RE.search(raw["itemText"] or "")
+    followers = followers_match.group(1).replace(",", "") if followers_match else None
+
+    # Every field is a string read from the page, so skip pydantic validation
+    return Interest.model_construct(
+        name=name, type=interest_type, url=url, followers=followers
+    )
@@ -1,12 +1,47 @@
 """Person-specific utility functions for LinkedIn scraping operations."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from playwright.async_api import Locator
-from rapidfuzz import fuzz
-
-
+from rapidfuzz import fuzz, process
+
+from ..utils import strip_list_marker
+
+# Date range patterns like "2020 - 2024", "Oct 2024 - Apr 2025",
+# "May 2024 - Present" and "2015 -"
+_DATE_RANGE_RE = re.compile(
+    r"^\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}\s*-\s*(?:(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}|Present)?\s*$",
+    re.IGNORECASE,
+)
+# A date range forming a whole "·"-separated part, e.g. in "Oct 2024 - Apr 2025 · 7 mos"
+_DATE_RANGE_PART_RE = re.compile(
+    r"(?:^|(?<=·))\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}\s*-\s*(?:(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}|Present)?\s*(?=·|$)",
+    re.IGNORECASE,
+)
+_FROM_DATE_RE = re.compile(
+    r"^(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}$", re.IGNORECASE
+)
+_TO_DATE_RE = re.compile(
+    r"^(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}$|^Present$",
+    re.IGNORECASE,
+)
+
+# Institution keywords, matched as substrings of lowercased text
+_INSTITUTION_WORDS = ("university", "college", "school", "institute", "hochschule")
+_INSTITUTION_RE = re.compile("|".join(_INSTITUTION_WORDS))
+# A split "skill" naming an institution rather than a skill
+_NON_SKILL_RE = re.compile("|".join((*_INSTITUTION_WORDS, "aachen", "technische")))
+# A "Skills:" line running on into institution or language info
+_SKILLS_CUTOFF_RE = re.compile(
+    "|".join((*_INSTITUTION_WORDS, "english", "german", "technische"))
+)
+# A line about an institution or language rather than the description
+_NON_DESCRIPTION_RE = re.compile("|".join((*_INSTITUTION_WORDS, "english", "german")))
+
+
+@lru_cache(maxsize=4096)
 def clean_single_string_duplicates(text: str) -> str:
     """Clean duplicated content within a single string (e.g., 'Manager\nManager' -> 'Manager').
 
@@ -18,25 +53,25 @@ def clean_single_string_duplicates(text: str) -> str:
     Returns:
         Cleaned string with duplications removed
     """
-    if not text or len(text) < 5:
-        return text.strip()
+    stripped = text.strip()
+    # Most texts are a single line and have nothing to deduplicate
+    if len(text) < 5 or "\n" not in stripped:
+        return stripped
+
+    # For simple cases (two lines), just take the first unique line
+    first_break = stripped.find("\n")
+    if stripped.rfind("\n") == first_break:
+        first, second = stripped[:first_break].strip(), stripped[first_break + 1 :]
+        if first == second.strip():
+            return first
 
     # Split by newlines and remove duplicate lines
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    if not lines:
-        return text.strip()
-
-    # For simple cases, just take the first unique line
-    if len(lines) == 2 and lines[0] == lines[1]:
-        return lines[0]
+    lines = [line.strip() for line in stripped.split("\n") if line.strip()]
 
-    # For more complex cases, remove duplicated lines
-    unique_lines = []
-    for line in lines:
-        if line not in unique_lines:
-            unique_lines.append(line)
+    # For more complex cases, remove duplicated lines (dicts keep insertion order)
+    unique_lines = list(dict.fromkeys(lines))
 
-    return " ".join(unique_lines) if unique_lines else text.strip()
+    return " ".join(unique_lines)
 
 
 def is_content_essentially_same_when_building_from_multiple_elements(
@@ -59,51 +94,112 @@ def is_content_essentially_same_when_building_from_multiple_elements(
         return False
 
     # Normalize the new line for comparison
-    normalized_new = new_line.strip()
-    # Remove common formatting markers
-    normalized_new = re.sub(r"^[-•*]\s*", "", normalized_new)
-    normalized_new = re.sub(r"^\d+\.\s*", "", normalized_new)
-
+    normalized_new = _normalize_for_comparison(new_line)
     if len(normalized_new) < 20:  # Too short to meaningfully compare
         return False
 
     # Check if the new line is just a combination of existing lines
-    combined_existing = []
+    existing_lower = []
     for existing_line in existing_lines:
-        normalized_existing = existing_line.strip()
-        # Remove common formatting markers
-        normalized_existing = re.sub(r"^[-•*]\s*", "", normalized_existing)
-        normalized_existing = re.sub(r"^\d+\.\s*", "", normalized_existing)
+        normalized_existing = _normalize_for_comparison(existing_line)
         if len(normalized_existing) >= 20:
-            combined_existing.append(normalized_existing)
+            existing_lower.append(normalized_existing.lower())
+
+    return _is_similar_to_normalized(normalized_new.lower(), existing_lower, threshold)
+
+
+def _normalize_for_comparison(line: str) -> str:
+    """Strip a line and remove common formatting markers (bullets, numbering)."""
+    return strip_list_marker(line.strip())
+
 
-    if not combined_existing:
+def _is_similar_to_normalized(
+    new_lower: str, existing_lower: list[str], threshold: int = 80
+) -> bool:
+    """Fuzzy-compare an already normalized, lowercased line against existing ones.
+
+    Args:
+        new_lower: Normalized, lowercased new line
+        existing_lower: Normalized, lowercased existing lines long enough to compare
+        threshold: Similarity threshold (0-100)
+
+    Returns:
+        True if the new line contains essentially the same content as existing lines
+    """
+    if not existing_lower:
         return False
 
-    # Method 1: Check if new line is similar to any individual existing line
-    for existing_content in combined_existing:
-        similarity = fuzz.ratio(normalized_new.lower(), existing_content.lower())
-        if similarity >= threshold:
-            return True
+    # Method 1: Check if new line is similar to any individual existing line;
+    # extractOne runs the whole comparison loop in rapidfuzz's C++ core
+    if (
+        process.extractOne(
+            new_lower, existing_lower, scorer=fuzz.ratio, score_cutoff=threshold
+        )
+        is not None
+    ):
+        return True
 
     # Method 2: Check if new line is similar to combined existing lines (handles concatenation)
-    combined_text = " ".join(combined_existing)
-    combined_similarity = fuzz.ratio(normalized_new.lower(), combined_text.lower())
-    if combined_similarity >= threshold:
+    combined_text = " ".join(existing_lower)
+    if _can_reach_ratio(new_lower, combined_text, threshold) and fuzz.ratio(
+        new_lower, combined_text, score_cutoff=threshold
+    ):
         return True
 
     # Method 3: Check if new line contains most of the content from existing lines
     # Use partial_ratio which handles cases where one string is much longer
-    for existing_content in combined_existing:
-        partial_sim = fuzz.partial_ratio(
-            existing_content.lower(), normalized_new.lower()
+    if (
+        process.extractOne(
+            new_lower,
+            existing_lower,
+            scorer=fuzz.partial_ratio,
+            score_cutoff=90,  # High threshold for partial matching
         )
-        if partial_sim >= 90:  # High threshold for partial matching
-            return True
+        is not None
+    ):
+        return True
 
     return False
 
 
+# Number of preceding description lines a new line is fuzzy-compared against;
+# LinkedIn repeats a line right next to the original, so a small window keeps
+# assembling long descriptions linear
+_DUPLICATE_WINDOW = 8
+
+
+def _add_description_line(
+    line: str, description_lines: list[str], comparable_lines: list[str]
+) -> None:
+    """Append a stripped line to description_lines unless it duplicates earlier ones.
+
+    comparable_lines holds the normalized, lowercased form of every description
+    line long enough to compare, so each line is normalized only once no matter
+    how many later lines are checked against it. Only the last
+    _DUPLICATE_WINDOW of them are compared against.
+    """
+    normalized = _normalize_for_comparison(line)
+    if len(normalized) < 20:  # Too short to meaningfully compare
+        description_lines.append(line)
+        return
+
+    normalized = normalized.lower()
+    recent_lines = comparable_lines[-_DUPLICATE_WINDOW:]
+    if not _is_similar_to_normalized(normalized, recent_lines):
+        description_lines.append(line)
+        comparable_lines.append(normalized)
+
+
+def _can_reach_ratio(a: str, b: str, threshold: int) -> bool:
+    """Check whether fuzz.ratio(a, b) can reach threshold given the lengths alone.
+
+    The ratio is at most 2 * min(len) / (len(a) + len(b)) * 100, so strings of
+    very different lengths are rejected without running the comparison.
+    """
+    shorter, total = min(len(a), len(b)), len(a) + len(b)
+    return 200 * shorter >= threshold * total
+
+
 def extract_description_and_skills(text: str) -> tuple[str, list[str]]:
     """Extract description and skills from LinkedIn text content.
 
@@ -142,18 +238,7 @@ def extract_description_and_skills(text: str) -> tuple[str, list[str]]:
                 if (
                     skill
                     and "\n" not in skill
-                    and not any(
-                        word in skill.lower()
-                        for word in [
-                            "university",
-                            "college",
-                            "school",
-                            "institute",
-                            "hochschule",
-                            "aachen",
-                            "technische",
-                        ]
-                    )
+                    and not _NON_SKILL_RE.search(skill.lower())
                 ):
                     clean_skills.append(skill)
 
@@ -163,6 +248,8 @@ def extract_description_and_skills(text: str) -> tuple[str, list[str]]:
     # Handle mixed content (description with skills section)
     lines = text.split("\n")
     description_lines = []
+    # Normalized forms of description_lines, see _add_description_line()
+    comparable_lines: list[str] = []
     skills = []
 
     for line in lines:
@@ -176,33 +263,12 @@ def extract_description_and_skills(text: str) -> tuple[str, list[str]]:
             if skills_text:
                 # Stop processing if we encounter institution names or non-skill content
                 # Skills should only contain skill names, not institution info
-                if any(
-                    word in skills_text.lower()
-                    for word in [
-                        "university",
-                        "college",
-                        "school",
-                        "institute",
-                        "hochschule",
-                        "english",
-                        "german",
-                        "technische",
-                    ]
-                ):
+                if _SKILLS_CUTOFF_RE.search(skills_text.lower()):
                     # Only take the part before institution names
                     skill_parts = skills_text.split()
                     clean_skills_text = ""
                     for part in skill_parts:
-                        if any(
-                            word in part.lower()
-                            for word in [
-                                "university",
-                                "college",
-                                "school",
-                                "institute",
-                                "hochschule",
-                            ]
-                        ):
+                        if _INSTITUTION_RE.search(part.lower()):
                             break
                         clean_skills_text += part + " "
                     skills_text = clean_skills_text.strip()
@@ -222,47 +288,98 @@ def extract_description_and_skills(text: str) -> tuple[str, list[str]]:
                         if (
                             skill
                             and "\n" not in skill
-                            and not any(
-                                word in skill.lower()
-                                for word in [
-                                    "university",
-                                    "college",
-                                    "school",
-                                    "institute",
-                                    "hochschule",
-                                    "aachen",
-                                    "technische",
-                                ]
-                            )
+                            and not _NON_SKILL_RE.search(skill.lower())
                         ):
                             clean_skills.append(skill)
                     skills.extend(clean_skills)
-        elif not any(
-            word in line.lower()
-            for word in [
-                "university",
-                "college",
-                "school",
-                "institute",
-                "hochschule",
-                "english",
-                "german",
-            ]
-        ) and not is_content_essentially_same_when_building_from_multiple_elements(
-            line, description_lines
-        ):
-            description_lines.append(line)
+        elif not _NON_DESCRIPTION_RE.search(line.lower()):
+            _add_description_line(line, description_lines, comparable_lines)
 
     description = "\n".join(description_lines) if description_lines else ""
 
     # Deduplicate skills while preserving order - use exact matching for skills
-    unique_skills = []
-    for skill in skills:
-        # For skills, use exact string matching for consistency
-        if skill not in unique_skills:
-            unique_skills.append(skill)
+    return description, list(dict.fromkeys(skills))
+
+
+# Reads the texts extract_description_and_skills_from_texts() needs from a
+# description element: null if it isn't visible, otherwise the text of every
+# item of every nested list (null when there are no lists) and, only when
+# there are no lists, the element's own text
+DESCRIPTION_TEXTS_JS = """(el) => {
+    if (!el || getComputedStyle(el).visibility === "hidden" || el.getClientRects().length === 0) {
+        return null;
+    }
+    const lists = Array.from(el.querySelectorAll("list, ul, .pvs-list"));
+    if (lists.length === 0) return { listItemTexts: null, text: el.innerText };
+    return {
+        listItemTexts: lists.flatMap((list) =>
+            Array.from(list.querySelectorAll("listitem, li, .pvs-list__item"), (item) => item.innerText)
+        ),
+        text: "",
+    };
+}"""
+
+
+def extract_description_and_skills_from_texts(
+    texts: Optional[dict],
+) -> tuple[str, list[str]]:
+    """Extract clean description and skills from texts read by DESCRIPTION_TEXTS_JS.
 
-    return description, unique_skills
+    Each list item's text is cleaned of duplicates on its own, then its lines are
+    split into skills (exact matching) and description lines (fuzzy matching).
+    Elements without lists are handed to extract_description_and_skills() whole.
+
+    Args:
+        texts: Result of DESCRIPTION_TEXTS_JS, or None if the element is missing
+
+    Returns:
+        Tuple of (description_text, skills_list)
+    """
+    if not texts:
+        return "", []
+
+    list_item_texts = texts["listItemTexts"]
+    if list_item_texts is None:
+        # Fallback: extract text directly from element
+        text = texts["text"].strip()
+        if text:
+            # For single element, clean duplicates first then extract
+            cleaned_text = clean_single_string_duplicates(text)
+            return extract_description_and_skills(cleaned_text)
+        return "", []
+
+    description_lines = []
+    # Normalized forms of description_lines, see _add_description_line()
+    comparable_lines: list[str] = []
+    skills = []
+
+    for text in list_item_texts:
+        text = text.strip()
+        if not text:
+            continue
+        # When building from multiple elements, clean each element's content first
+        cleaned_text = clean_single_string_duplicates(text)
+        for line in cleaned_text.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("Skills:"):
+                # Extract skills from line like "Skills: Java · Python · etc"
+                skills_text = line[7:].strip()  # Remove "Skills: " prefix
+                if skills_text:
+                    separator = "·" if "·" in skills_text else ","
+                    skills.extend(
+                        skill.strip()
+                        for skill in skills_text.split(separator)
+                        if skill.strip()
+                    )
+            else:
+                _add_description_line(line, description_lines, comparable_lines)
+
+    description = "\n".join(description_lines) if description_lines else ""
+
+    # Deduplicate skills while preserving order - use exact matching for skills
+    return description, list(dict.fromkeys(skills))
 
 
 async def extract_description_and_skills_from_element(
@@ -270,9 +387,8 @@ async def extract_description_and_skills_from_element(
 ) -> tuple[str, list[str]]:
     """Extract clean description and skills from DOM element with nested list structure.
 
-    This function handles complex DOM traversal and delegates to extract_description_and_skills()
-    for text processing. It applies deduplication at the DOM level (cleaning individual elements)
-    and at the content level (exact matching for skills, fuzzy matching for descriptions).
+    Reads all the element's texts in one round-trip with DESCRIPTION_TEXTS_JS and
+    delegates to extract_description_and_skills_from_texts() for text processing.
 
     Args:
         element: The DOM element containing description lists
@@ -280,88 +396,22 @@ async def extract_description_and_skills_from_element(
     Returns:
         Tuple of (description_text, skills_list)
     """
-    if not element or not await element.is_visible():
+    if not element:
         return "", []
 
-    description_lines = []
-    skills = []
-
     try:
-        # Navigate to nested list structure based on DOM analysis
-        # Look for list containers and their items
-        lists = await element.locator("list, ul, .pvs-list").all()
-        if lists:
-            for list_elem in lists:
-                list_items = await list_elem.locator(
-                    "listitem, li, .pvs-list__item"
-                ).all()
-                for item in list_items:
-                    text = (await item.inner_text()).strip()
-                    if text:
-                        # When building from multiple elements, clean each element's content first
-                        cleaned_text = clean_single_string_duplicates(text)
-                        lines = cleaned_text.split("\n")
-                        for line in lines:
-                            line = line.strip()
-                            if line:
-                                if line.startswith("Skills:"):
-                                    # Extract skills from line like "Skills: Java · Python · etc"
-                                    skills_text = line[
-                                        7:
-                                    ].strip()  # Remove "Skills: " prefix
-                                    if skills_text:
-                                        if "·" in skills_text:
-                                            extracted_skills = [
-                                                skill.strip()
-                                                for skill in skills_text.split("·")
-                                            ]
-                                        else:
-                                            extracted_skills = [
-                                                skill.strip()
-                                                for skill in skills_text.split(",")
-                                            ]
-                                        skills.extend(
-                                            [
-                                                skill
-                                                for skill in extracted_skills
-                                                if skill
-                                            ]
-                                        )
-                                elif not is_content_essentially_same_when_building_from_multiple_elements(
-                                    line, description_lines
-                                ):
-                                    description_lines.append(line)
-        else:
-            # Fallback: extract text directly from element
-            text = (await element.inner_text()).strip()
-            if text:
-                # For single element, clean duplicates first then extract
-                cleaned_text = clean_single_string_duplicates(text)
-                return extract_description_and_skills(cleaned_text)
-
+        if not await element.is_visible():
+            return "", []
+        texts = await element.evaluate(DESCRIPTION_TEXTS_JS)
     except Exception:
-        # Fallback: try to extract text directly
-        try:
-            text = (await element.inner_text()).strip()
-            if text:
-                # For single element, clean duplicates first then extract
-                cleaned_text = clean_single_string_duplicates(text)
-                return extract_description_and_skills(cleaned_text)
-        except Exception:
-            pass
-
-    description = "\n".join(description_lines) if description_lines else ""
-
-    # Deduplicate skills while preserving order - use exact matching for skills
-    unique_skills = []
-    for skill in skills:
-        # For skills, use exact string matching for better deduplication
-        if skill not in unique_skills:
-            unique_skills.append(skill)
+        # The element is gone (e.g. detached); reading its text directly would
+        # fail the same way after another round-trip
+        return "", []
 
-    return description, unique_skills
+    return extract_description_and_skills_from_texts(texts)
 
 
+@lru_cache(maxsize=4096)
 def is_date_range(text: str) -> bool:
     """Check if text contains a LinkedIn date range pattern.
 
@@ -386,12 +436,31 @@ def is_date_range(text: str) -> bool:
     if not text or "-" not in text:
         return False
 
-    # Match patterns like:
-    # "2020 - 2024", "Oct 2024 - Apr 2025", "May 2024 - Present", "2015 -"
-    date_pattern = r"^\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}\s*-\s*(?:(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}|Present)?\s*$"
-    return bool(re.match(date_pattern, text.strip(), re.IGNORECASE))
+    # The shortest date range is a year and a dash ("2015-"), and every one
+    # starts with a year digit or a month name
+    stripped = text.strip()
+    if len(stripped) < 5 or not (stripped[0].isdecimal() or stripped[0].isalpha()):
+        return False
+
+    return bool(_DATE_RANGE_RE.match(stripped))
+
+
+def contains_date_range(text: str) -> bool:
+    """Check if any "·"-separated part of text is a LinkedIn date range.
+
+    Equivalent to ``any(is_date_range(part) for part in text.split("·"))`` but
+    done in a single regex pass without splitting.
+
+    Args:
+        text: Text like "Oct 2024 - Apr 2025 · 7 mos"
 
+    Returns:
+        True if one of the parts is a date range, False otherwise
+    """
+    return bool(_DATE_RANGE_PART_RE.search(text))
 
+
+@lru_cache(maxsize=4096)
 def parse_date_range_smart(text: str) -> tuple[str, str]:
     """Parse date range with regex validation and return (from_date, to_date).
 
@@ -420,17 +489,12 @@ def parse_date_range_smart(text: str) -> tuple[str, str]:
     to_date = parts[1].strip() if len(parts) > 1 else ""
 
     # Validate that from_date looks like a date
-    from_date_pattern = (
-        r"^(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}$"
-    )
-    if not re.match(from_date_pattern, from_date, re.IGNORECASE):
+    if not _FROM_DATE_RE.match(from_date):
         return "", ""
 
     # Validate to_date (can be empty for ongoing, "Present", or another date)
-    if to_date:
-        to_date_pattern = r"^(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+)?\d{4}$|^Present$"
-        if not re.match(to_date_pattern, to_date, re.IGNORECASE):
-            return "", ""
+    if to_date and not _TO_DATE_RE.match(to_date):
+        return "", ""
 
     return from_date, to_date
 
@@ -456,7 +520,16 @@ LINKEDIN_EMPLOYMENT_TYPES = {
     "work study",
 }
 
+# Matches any employment type as a substring of lowercased text in one pass
+_EMPLOYMENT_TYPE_RE = re.compile(
+    "|".join(
+        re.escape(emp_type)
+        for emp_type in sorted(LINKEDIN_EMPLOYMENT_TYPES, key=len, reverse=True)
+    )
+)
+
 
+@lru_cache(maxsize=4096)
 def is_employment_type(text: str) -> bool:
     """Check if text contains a LinkedIn employment type.
 
@@ -484,13 +557,10 @@ def is_employment_type(text: str) -> bool:
         return True
 
     # Check if any employment type is contained in the text
-    for emp_type in LINKEDIN_EMPLOYMENT_TYPES:
-        if emp_type in text_lower:
-            return True
-
-    return False
+    return bool(_EMPLOYMENT_TYPE_RE.search(text_lower))
 
 
+@lru_cache(maxsize=4096)
 def extract_employment_type(text: str) -> Optional[str]:
     """Extract employment type from text that may contain mixed content.
 
@@ -527,17 +597,56 @@ def extract_employment_type(text: str) -> Optional[str]:
                     return part.strip()
 
     # Check if any employment type is contained in the text
-    for emp_type in LINKEDIN_EMPLOYMENT_TYPES:
-        if emp_type in text_lower:
-            # Try to extract just the employment type part
-            words = text.split()
-            for word in words:
-                if word.lower().strip() in LINKEDIN_EMPLOYMENT_TYPES:
-                    return word.strip()
+    if _EMPLOYMENT_TYPE_RE.search(text_lower):
+        # Try to extract just the employment type part
+        words = text.split()
+        for word in words:
+            if word.lower().strip() in LINKEDIN_EMPLOYMENT_TYPES:
+                return word.strip()
 
     return None
 
 
+# Geographic indicators, matched as substrings of lowercased text
+_LOCATION_INDICATORS = [
+    ",",  # "City, State/Province"
+    "area",
+    "region",
+    "metropolitan",
+    "remote",
+    "on-site",
+    "hybrid",
+    "germany",
+    "austria",
+    "canada",
+    "usa",
+    "united states",
+    "uk",
+    "france",
+    "city",
+    "state",
+    "province",
+    "country",
+    "district",
+    "county",
+    "am main",
+    "rhine-main",
+    "greater",
+    "toronto",
+    "frankfurt",
+    "linz",
+    "hanau",
+    "aachen",
+    "hesse",
+    "upper austria",
+    "ontario",
+]
+_LOCATION_INDICATOR_RE = re.compile(
+    "|".join(re.escape(indicator) for indicator in _LOCATION_INDICATORS)
+)
+
+
+@lru_cache(maxsize=4096)
 def is_geographic_location(text: str) -> bool:
     """Check if text appears to be a geographic location rather than employment type.
 
@@ -566,39 +675,4 @@ def is_geographic_location(text: str) -> bool:
     if is_employment_type(text):
         return False
 
-    # Geographic indicators
-    location_indicators = [
-        ",",  # "City, State/Province"
-        "area",
-        "region",
-        "metropolitan",
-        "remote",
-        "on-site",
-        "hybrid",
-        "germany",
-        "austria",
-        "canada",
-        "usa",
-        "united states",
-        "uk",
-        "france",
-        "city",
-        "state",
-        "province",
-        "country",
-        "district",
-        "county",
-        "am main",
-        "rhine-main",
-        "greater",
-        "toronto",
-        "frankfurt",
-        "linz",
-        "hanau",
-        "aachen",
-        "hesse",
-        "upper austria",
-        "ontario",
-    ]
-
-    return any(indicator in text_lower for indicator in location_indicators)
+    return bool(_LOCATION_INDICATOR_RE.search(text_lower))
@@ -1,11 +1,159 @@
 """Utility functions for LinkedIn scraping operations."""
 
+import asyncio
 import re
-from typing import Dict, Optional
+import time
+from bisect import bisect_right
+from collections import Counter
+from typing import Awaitable, Callable, Collection, Dict, List, Optional, Tuple, Union
 
-from playwright.async_api import Locator, Page
+from playwright.async_api import Locator, Page, Route
 from pydantic import HttpUrl
 
+# Patterns used by clean_text and clean_duplicated_text
+_WS_RE = re.compile(r"\s+")
+_DOT_RE = re.compile(r"·+")
+# Words, whitespace runs and runs of anything else, as (word, space, other) groups
+_TOKEN_RE = re.compile(r"(\w+)|(\s+)|[^\w\s]+")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+_TRAILING_DASH_RE = re.compile(r"\s*-\s*$")
+
+
+class RateLimiter:
+    """Token bucket limiting how often an operation may start across tasks."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Tokens added per second, i.e. the sustained operations per second
+            burst: Maximum number of tokens, i.e. operations allowed back-to-back
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# Resource types scrapers don't need; they only read text and attributes.
+# Stylesheets stay enabled because visibility checks depend on layout.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Analytics and ad beacons, blocked whatever their resource type
+_TRACKING_URL_RE = re.compile(
+    r"google-analytics\.com|doubleclick\.net|googletagmanager\.com"
+    r"|px\.ads\.linkedin\.com|linkedin\.com/li/track"
+)
+
+# URLs that almost always load a resource of the given type. Route patterns are
+# matched by the Playwright driver, so only these requests reach Python.
+_RESOURCE_URL_PATTERNS = {
+    "image": r"\.(?:png|jpe?g|gif|webp|svg|ico)(?:[?#]|$)|media\.licdn\.com/dms/image/",
+    "media": r"\.(?:mp4|webm|m3u8|mp3|ogg)(?:[?#]|$)",
+    "font": r"\.(?:woff2?|ttf|otf|eot)(?:[?#]|$)",
+}
+
+RouteHandler = Callable[[Route], Awaitable[None]]
+
+
+def resource_routes(
+    resource_types: Collection[str] = BLOCKED_RESOURCE_TYPES,
+) -> List[Tuple[Union[re.Pattern[str], str], RouteHandler]]:
+    """Build routes aborting the given resource types and trackers.
+
+    Known resource types are matched by URL pattern in the driver, so other
+    requests don't round-trip through Python. Types without a known pattern
+    fall back to a catch-all route checking each request's resource type.
+
+    Args:
+        resource_types: Playwright resource types to abort (e.g. "image")
+
+    Returns:
+        (url, handler) pairs to pass to ``page.route`` or ``context.route``
+        (and ``unroute`` to remove them again)
+    """
+    resource_types = frozenset(resource_types)
+    routes: List[Tuple[Union[re.Pattern[str], str], RouteHandler]] = [
+        (_TRACKING_URL_RE, _abort)
+    ]
+    if resource_types - _RESOURCE_URL_PATTERNS.keys():
+        routes.append(("**/*", resource_blocker(resource_types)))
+    elif resource_types:
+        pattern = "|".join(_RESOURCE_URL_PATTERNS[t] for t in sorted(resource_types))
+        # The type check still applies, e.g. to a page navigated to an image URL
+        routes.append((re.compile(pattern), resource_blocker(resource_types)))
+    return routes
+
+
+async def _abort(route: Route) -> None:
+    """Abort a routed request."""
+    await route.abort()
+
+
+def resource_blocker(
+    resource_types: Collection[str] = BLOCKED_RESOURCE_TYPES,
+) -> Callable[[Route], Awaitable[None]]:
+    """Create a route handler aborting the given resource types and trackers.
+
+    Args:
+        resource_types: Playwright resource types to abort (e.g. "image")
+
+    Returns:
+        Route handler for ``context.route("**/*", handler)``
+    """
+    resource_types = frozenset(resource_types)
+
+    async def block(route: Route) -> None:
+        await _abort_or_fallback(route, resource_types)
+
+    return block
+
+
+async def _abort_or_fallback(route: Route, resource_types: frozenset[str]) -> None:
+    """Abort a request of one of resource_types or to a tracker, else fall back.
+
+    Falling back (rather than continuing) lets other matching routes, e.g. a
+    caller's own page routes, still handle the request.
+    """
+    request = route.request
+    if request.resource_type in resource_types or _TRACKING_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.fallback()
+
+
+# True once the document has loaded and no lazy-load spinner is showing; wait
+# on it with page.wait_for_function after scrolling
+PAGE_READY_JS = "() => document.readyState === 'complete' && !document.querySelector('.artdeco-loader')"
+
+# Scrolls to the bottom until document height stops changing between scrolls
+_SCROLL_TO_END_JS = """async ([maxScrolls, interval]) => {
+    let lastHeight = -1;
+    for (let i = 0; i < maxScrolls; i++) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise((resolve) => setTimeout(resolve, interval));
+        if (document.body.scrollHeight === lastHeight) return;
+        lastHeight = document.body.scrollHeight;
+    }
+}"""
+
 
 async def scroll_to_half(page: Page) -> None:
     """Scroll to half of the page to trigger content loading."""
@@ -17,42 +165,65 @@ async def scroll_to_bottom(page: Page) -> None:
     await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
 
 
+async def scroll_to_end(page: Page, max_scrolls: int = 15, interval: int = 200) -> None:
+    """Scroll to the bottom repeatedly until the page stops growing.
+
+    The whole loop runs in the page, so it costs a single round-trip.
+
+    Args:
+        page: Playwright page instance
+        max_scrolls: Maximum number of scrolls to the bottom
+        interval: Milliseconds to wait after each scroll for new content
+    """
+    await page.evaluate(_SCROLL_TO_END_JS, [max_scrolls, interval])
+
+
+# Read the first matched element's text or an attribute, like inner_text() and
+# get_attribute() behind an is_visible() check, in one round-trip. Used with
+# evaluate_all, which doesn't wait for the element, so missing ones return
+# immediately.
+_VISIBLE_TEXT_JS = """(elements) => {
+    const el = elements[0];
+    if (!el || getComputedStyle(el).visibility === "hidden" || el.getClientRects().length === 0) {
+        return "";
+    }
+    return el.innerText.trim();
+}"""
+_VISIBLE_ATTRIBUTE_JS = """(elements, attribute) => {
+    const el = elements[0];
+    if (!el || getComputedStyle(el).visibility === "hidden" || el.getClientRects().length === 0) {
+        return null;
+    }
+    return el.getAttribute(attribute);
+}"""
+
+
 async def safe_text_extract(locator: Locator) -> str:
     """Safely extract text from a locator, returning empty string if not found."""
     try:
-        if await locator.is_visible():
-            return (await locator.inner_text()).strip()
+        return await locator.evaluate_all(_VISIBLE_TEXT_JS)
     except Exception:
-        pass
-    return ""
+        return ""
 
 
 async def safe_attribute_extract(locator: Locator, attribute: str) -> Optional[str]:
     """Safely extract an attribute from a locator, returning None if not found."""
     try:
-        if await locator.is_visible():
-            return await locator.get_attribute(attribute)
+        return await locator.evaluate_all(_VISIBLE_ATTRIBUTE_JS, attribute)
     except Exception:
-        pass
-    return None
+        return None
 
 
 async def extract_linkedin_url(element: Locator) -> Optional[str]:
     """Extract LinkedIn URL from an element, typically from href attribute."""
-    try:
-        # Look for direct href
-        href = await safe_attribute_extract(element, "href")
-        if href:
-            return href
+    # Look for direct href
+    href = await safe_attribute_extract(element, "href")
+    if href:
+        return href
 
-        # Look for href in child elements
-        child_with_href = element.locator("a, [href]").first
-        if await child_with_href.is_visible():
-            return await safe_attribute_extract(child_with_href, "href")
-
-    except Exception:
-        pass
-    return None
+    # Look for href in child elements; safe_attribute_extract already checks
+    # that the child is visible
+    return await safe_attribute_extract(element.locator("a, [href]").first, "href")
 
 
 def parse_date_range(date_text: str) -> Dict[str, Optional[str]]:
@@ -73,28 +244,24 @@ def parse_date_range(date_text: str) -> Dict[str, Optional[str]]:
     if not date_text:
         return result
 
-    try:
-        # Split by middle dot (·) to separate dates from duration
-        parts = date_text.split("·")
-        date_part = parts[0].strip() if parts else ""
-        duration_part = parts[1].strip() if len(parts) > 1 else None
-
-        # Parse dates
-        if date_part and "-" in date_part:
-            date_components = date_part.split("-")
-            if len(date_components) >= 2:
-                result["from_date"] = date_components[0].strip()
-                result["to_date"] = date_components[1].strip()
-        elif date_part:
-            # Single date (ongoing or single point)
-            result["from_date"] = date_part.strip()
-
-        # Parse duration
-        if duration_part:
-            result["duration"] = duration_part
-
-    except Exception:
-        pass
+    # Separate dates from duration at the first middle dot (·); only the
+    # first part after it is the duration
+    date_part, _, rest = date_text.partition("·")
+    date_part = date_part.strip()
+    duration_part = rest.partition("·")[0].strip()
+
+    # Parse dates
+    if "-" in date_part:
+        from_date, _, to_date = date_part.partition("-")
+        result["from_date"] = from_date.strip()
+        result["to_date"] = to_date.partition("-")[0].strip()
+    elif date_part:
+        # Single date (ongoing or single point)
+        result["from_date"] = date_part
+
+    # Parse duration
+    if duration_part:
+        result["duration"] = duration_part
 
     return result
 
@@ -104,16 +271,34 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove extra whitespace and normalize
-    cleaned = re.sub(r"\s+", " ", text.strip())
+    # Remove extra whitespace and normalize; splitting on whitespace also
+    # collapses newlines, so no separate newline pass is needed
+    cleaned = " ".join(text.split())
 
-    # Remove common LinkedIn artifacts
-    cleaned = re.sub(r"\n+", "\n", cleaned)
-    cleaned = re.sub(r"·+", "·", cleaned)
+    # Remove common LinkedIn artifacts (repeated middle dots)
+    if "··" in cleaned:
+        cleaned = _DOT_RE.sub("·", cleaned)
 
     return cleaned
 
 
+def strip_list_marker(text: str) -> str:
+    """Remove a leading bullet ("- ", "• ", "* ") and/or numbering ("1. ").
+
+    Whitespace after a removed marker is dropped too. Plain string checks are
+    used because this runs for every line of every description.
+    """
+    if text and text[0] in "-•*":
+        text = text[1:].lstrip()
+    if text and text[0].isdecimal():
+        i = 1
+        while i < len(text) and text[i].isdecimal():
+            i += 1
+        if i < len(text) and text[i] == ".":
+            text = text[i + 1 :].lstrip()
+    return text
+
+
 def clean_duplicated_text(text: str) -> str:
     """Remove duplicated content from text that appears due to LinkedIn's DOM structure.
 
@@ -126,78 +311,126 @@ def clean_duplicated_text(text: str) -> str:
     if not text:
         return ""
 
-    # Split into lines and process each line
-    lines = text.split("\n")
-    unique_lines = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Check if this exact line already exists
-        if line not in unique_lines:
-            unique_lines.append(line)
+    # Split into lines, dropping empty ones and exact repeats (dicts keep
+    # insertion order, so the first occurrence of each line wins)
+    stripped_lines = (line.strip() for line in text.split("\n"))
+    unique_lines = list(dict.fromkeys(line for line in stripped_lines if line))
 
     # Join the unique lines back together
     result = "\n".join(unique_lines)
 
     # Additional cleanup for within-line duplications
     # Handle cases where same text appears multiple times in one line
-    result = re.sub(r"\b(\w+(?:\s+\w+)*)\s+\1\b", r"\1", result)
+    result = _remove_repeated_words(result)
 
     # Universal approach: detect if content is duplicated regardless of formatting
     lines = result.split("\n")
     if len(lines) >= 2:
+        # Normalized words of every line, computed once: as compared against
+        # other lines (formatting markers removed) and as the line itself
+        marker_free_words = [
+            _normalized_words(strip_list_marker(line.strip())) for line in lines
+        ]
+        # Number of lines each word appears in, so the words of "all other
+        # lines" can be derived per line without rebuilding them
+        line_counts = Counter(word for words in marker_free_words for word in words)
+
         # Check if any line contains most/all content from other lines (suggesting duplication)
         for i, line_to_check in enumerate(lines):
             line_to_check = line_to_check.strip()
             if len(line_to_check) < 30:  # Skip very short lines
                 continue
 
-            # Get content from all other lines
-            other_lines_content = []
-            for j, other_line in enumerate(lines):
-                if i != j:  # Skip the line we're checking
-                    # Remove common formatting markers (not just bullets)
-                    clean_line = re.sub(r"^[-•*]\s*", "", other_line.strip())
-                    clean_line = re.sub(
-                        r"^\d+\.\s*", "", clean_line
-                    )  # Remove numbered lists
-                    if clean_line:
-                        other_lines_content.append(clean_line)
-
-            if other_lines_content:
-                # Check if this line contains the same content as other lines combined
-                combined_others = " ".join(other_lines_content)
-
-                # Normalize both for comparison (remove all non-alphanumeric chars)
-                normalized_line = re.sub(r"[^\w\s]", "", line_to_check.lower())
-                normalized_others = re.sub(r"[^\w\s]", "", combined_others.lower())
-
-                # Split into words and check overlap
-                words_line = set(normalized_line.split())
-                words_others = set(normalized_others.split())
-
-                # If the line contains >80% of words from other lines, it's likely a duplicate
-                if len(words_others) > 0:
-                    overlap = len(words_line.intersection(words_others))
-                    coverage = overlap / len(words_others)
-
-                    if coverage > 0.8 and len(words_line) > len(words_others) * 0.5:
-                        # This line appears to be a duplicate - remove it
-                        lines.pop(i)
-                        result = "\n".join(lines)
-                        break  # Only remove one duplicate per pass
+            # A word occurs in another line if it isn't only counted for this one
+            own_words = marker_free_words[i]
+            words_line = _normalized_words(line_to_check)
+            other_word_count = len(line_counts) - sum(
+                1 for word in own_words if line_counts[word] == 1
+            )
+
+            # If the line contains >80% of words from other lines, it's likely a duplicate
+            if other_word_count > 0:
+                overlap = sum(
+                    1
+                    for word in words_line
+                    if line_counts[word] > (1 if word in own_words else 0)
+                )
+                coverage = overlap / other_word_count
+
+                if coverage > 0.8 and len(words_line) > other_word_count * 0.5:
+                    # This line appears to be a duplicate - remove it
+                    lines.pop(i)
+                    result = "\n".join(lines)
+                    break  # Only remove one duplicate per pass
 
     # Clean up any remaining artifacts from the removal
-    result = re.sub(r"\s+", " ", result)  # Multiple spaces
-    result = re.sub(r"\n\s*\n", "\n", result)  # Multiple newlines
-    result = re.sub(r"\s*-\s*$", "", result)  # Trailing dash from removed content
+    result = _WS_RE.sub(" ", result)  # Multiple spaces
+    result = _BLANK_LINES_RE.sub("\n", result)  # Multiple newlines
+    result = _TRAILING_DASH_RE.sub("", result)  # Trailing dash from removed content
 
     return result.strip()
 
 
+def _remove_repeated_words(text: str) -> str:
+    r"""Drop the second of two directly repeated word sequences ("a b a b" -> "a b").
+
+    Same result as substituting \b(\w+(?:\s+\w+)*)\s+\1\b with its group, but
+    only sequence lengths whose repeat starts with the same word are tried, so
+    the work doesn't grow quadratically with the number of distinct words.
+    """
+    tokens = []
+    is_word = []
+    for match in _TOKEN_RE.finditer(text):
+        tokens.append(match.group())
+        is_word.append(match.lastindex == 1)
+    n = len(tokens)
+
+    # Index of the last word in the run of whitespace-separated words each
+    # word belongs to; repeats never cross punctuation
+    run_end = list(range(n))
+    for i in range(n - 3, -1, -1):
+        if is_word[i] and is_word[i + 2] and tokens[i + 1].isspace():
+            run_end[i] = run_end[i + 2]
+
+    # Token positions of every word, in order
+    positions: dict[str, list[int]] = {}
+    for i in range(n):
+        if is_word[i]:
+            positions.setdefault(tokens[i], []).append(i)
+
+    out = []
+    i = 0
+    while i < n:
+        if not is_word[i]:
+            out.append(tokens[i])
+            i += 1
+            continue
+
+        # The repeat starts with the same word; try the longest sequence first
+        # that still fits twice into the run
+        words_here = positions[tokens[i]]
+        run_words = (run_end[i] - i) // 2 + 1
+        limit = i + 2 * (run_words // 2)
+        first = bisect_right(words_here, i)
+        last = bisect_right(words_here, limit)
+        for repeat_start in reversed(words_here[first:last]):
+            end = repeat_start - 1
+            if tokens[i:end] == tokens[repeat_start : 2 * repeat_start - i - 1]:
+                out.extend(tokens[i:end])
+                i = 2 * repeat_start - i - 1
+                break
+        else:
+            out.append(tokens[i])
+            i += 1
+
+    return "".join(out)
+
+
+def _normalized_words(text: str) -> set[str]:
+    """Return the lowercased words of text with all non-alphanumeric chars removed."""
+    return set(_NON_WORD_RE.sub("", text.lower()).split())
+
+
 def validate_linkedin_url(url: str) -> Optional[HttpUrl]:
     """Validate and return a LinkedIn URL, or None if invalid."""
     if not url:
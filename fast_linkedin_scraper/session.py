@@ -1,34 +1,144 @@
 """High-level LinkedIn scraping session API."""
 
-from playwright.async_api import Page
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Collection, List, Optional
+
+from playwright.async_api import BrowserContext, Page
 
 from .auth import CookieAuth, LinkedInAuth, PasswordAuth
-from .browser import BrowserContextManager
+from .browser import BrowserContextManager, close_shared_browsers
 from .config import CompanyScrapingFields, PersonScrapingFields
 from .models.company import Company
 from .models.person import Person
+from .scrapers.company import CompanyScraper
+from .scrapers.person import PersonScraper
+from .scrapers.utils import BLOCKED_RESOURCE_TYPES, resource_routes
+
+
+class _PagePool:
+    """Bounded pool of reusable pages in one browser context."""
+
+    def __init__(self, context: BrowserContext, max_pages: int):
+        """Initialize the pool.
+
+        Args:
+            context: Browser context new pages are opened in
+            max_pages: Maximum number of pages in use at once
+        """
+        self._context = context
+        self._semaphore = asyncio.Semaphore(max_pages)
+        self._idle: asyncio.Queue[Page] = asyncio.Queue()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Borrow a page, opening one only if no idle page is left."""
+        async with self._semaphore:
+            try:
+                page = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                page = await self._context.new_page()
+            try:
+                yield page
+            finally:
+                await self._release(page)
+
+    async def _release(self, page: Page) -> None:
+        """Reset a borrowed page and return it, or drop it if it's unusable."""
+        if page.is_closed():
+            return
+        try:
+            # Stop whatever the last scrape left running before reusing the page
+            await page.goto("about:blank")
+        except Exception:
+            await page.close()
+            return
+        self._idle.put_nowait(page)
 
 
 class LinkedInSession:
     """High-level LinkedIn scraping session that manages authentication and browser state."""
 
-    def __init__(self, auth: LinkedInAuth, headless: bool = True):
+    def __init__(
+        self,
+        auth: LinkedInAuth,
+        headless: bool = True,
+        storage_state_path: Optional[str] = None,
+        share_browser: bool = False,
+        max_concurrent_pages: int = 4,
+        storage_state_max_age: float = 24 * 60 * 60,
+        force_refresh: bool = False,
+        block_resources: Optional[Collection[str]] = None,
+        recycle_every: int = 50,
+        persistent_profile: Optional[str] = None,
+        profile_cache_ttl: float = 0,
+    ):
         """Initialize LinkedIn session parameters.
 
         Args:
             auth: Authentication instance (PasswordAuth, CookieAuth, etc.)
             headless: Whether to run browser in headless mode
+            storage_state_path: File to restore the logged-in browser state from
+                and save it to after login, so later sessions skip the login
+            share_browser: Run in a browser shared with other sessions instead of
+                launching one; closing the session only closes its context, and
+                LinkedInSession.shutdown_shared_browsers() closes the browser
+            max_concurrent_pages: Maximum number of pooled pages get_profile,
+                get_profiles and get_company use at once; pages are reused
+                between calls. Each profile scrape also opens up to
+                PersonScraper's max_concurrent_sections (3) section pages of
+                its own, so up to 4 * max_concurrent_pages pages can be open.
+            storage_state_max_age: Seconds a saved storage state is restored
+                for; older states are ignored and a full login is done
+            force_refresh: Ignore any saved storage state and log in again
+            block_resources: Resource types (e.g. "image", "stylesheet") not
+                downloaded once logged in (default: images, media and fonts);
+                analytics and ad beacons are always blocked
+            recycle_every: Replace the browser context, keeping its login, after
+                this many pages served to get_profile, get_profiles and
+                get_company to bound its memory growth (0 disables)
+            persistent_profile: Browser profile directory to keep the login,
+                cookies and cache in between runs (instead of a fresh browser
+                each time); its login is reused while still valid
+            profile_cache_ttl: Seconds get_profile, get_profiles and
+                get_profiles_stream reuse a complete scrape of the same URL and
+                fields within this session, e.g. for retried or overlapping
+                batches (default 0: disabled)
         """
         self._auth = auth
         self._headless = headless
+        self._storage_state_path = storage_state_path
+        self._share_browser = share_browser
+        self._max_concurrent_pages = max_concurrent_pages
+        self._storage_state_max_age = storage_state_max_age
+        self._force_refresh = force_refresh
+        self._block_resources = block_resources
+        self._recycle_every = recycle_every
+        self._persistent_profile = persistent_profile
+        self._profile_cache_ttl = profile_cache_ttl
+        # Pool pages borrowed right now, and borrowed since the context was created
+        self._pages_in_use = 0
+        self._pages_served = 0
+        self._page_condition = asyncio.Condition()
+        self._close_lock = asyncio.Lock()
         self._browser_session = None
         self._context = None
         self._page = None
+        self._page_pool: Optional[_PagePool] = None
+        self._person_scraper_instance: Optional[PersonScraper] = None
         self._authenticated = False
 
     @classmethod
     def from_password(
-        cls, email: str, password: str, interactive: bool = False, headless: bool = True
+        cls,
+        email: str,
+        password: str,
+        interactive: bool = False,
+        headless: bool = True,
+        storage_state_path: Optional[str] = None,
+        share_browser: bool = False,
     ) -> "LinkedInSession":
         """Convenience method to create session with password authentication.
 
@@ -37,26 +147,51 @@ class LinkedInSession:
             password: LinkedIn password
             interactive: If True, pause for manual captcha/challenge solving
             headless: Whether to run browser in headless mode
+            storage_state_path: File to restore and save the logged-in browser state
+            share_browser: Run in a browser shared with other sessions
 
         Returns:
             LinkedInSession instance
         """
         auth = PasswordAuth(email, password, interactive=interactive)
-        return cls(auth, headless=headless)
+        return cls(
+            auth,
+            headless=headless,
+            storage_state_path=storage_state_path,
+            share_browser=share_browser,
+        )
 
     @classmethod
-    def from_cookie(cls, cookie: str, headless: bool = True) -> "LinkedInSession":
+    def from_cookie(
+        cls,
+        cookie: str,
+        headless: bool = True,
+        storage_state_path: Optional[str] = None,
+        share_browser: bool = False,
+    ) -> "LinkedInSession":
         """Convenience method to create session with cookie authentication.
 
         Args:
             cookie: LinkedIn li_at cookie value
             headless: Whether to run browser in headless mode
+            storage_state_path: File to restore and save the logged-in browser state
+            share_browser: Run in a browser shared with other sessions
 
         Returns:
             LinkedInSession instance
         """
         auth = CookieAuth(cookie)
-        return cls(auth, headless=headless)
+        return cls(
+            auth,
+            headless=headless,
+            storage_state_path=storage_state_path,
+            share_browser=share_browser,
+        )
+
+    @staticmethod
+    async def shutdown_shared_browsers() -> None:
+        """Close the browsers shared by sessions created with share_browser=True."""
+        await close_shared_browsers()
 
     def is_authenticated(self) -> bool:
         """Check if session is authenticated.
@@ -85,6 +220,76 @@ class LinkedInSession:
             )
         return self._page
 
+    @asynccontextmanager
+    async def _acquire_page(self) -> AsyncIterator[Page]:
+        """Borrow a page of the authenticated context from the page pool.
+
+        Raises:
+            RuntimeError: If not authenticated
+        """
+        self._ensure_authenticated()
+        async with self._page_condition:
+            if self._recycle_due():
+                # Let borrowed pages finish; new borrowers queue up behind us
+                await self._page_condition.wait_for(lambda: self._pages_in_use == 0)
+                # Another waiter may have recycled the context in the meantime
+                if self._recycle_due():
+                    await self._recycle_context()
+            self._pages_in_use += 1
+            self._pages_served += 1
+
+        try:
+            page = self._ensure_authenticated()
+            if self._page_pool is None:
+                self._page_pool = _PagePool(page.context, self._max_concurrent_pages)
+            async with self._page_pool.page() as pooled_page:
+                yield pooled_page
+        finally:
+            async with self._page_condition:
+                self._pages_in_use -= 1
+                self._page_condition.notify_all()
+
+    def borrow_page(self) -> AsyncContextManager[Page]:
+        """Borrow an authenticated page from the session's page pool.
+
+        Use as ``async with session.borrow_page() as page:`` to run custom
+        scraping (e.g. a single section scraper) next to the session's own
+        calls; the page returns to the pool afterwards.
+
+        Raises:
+            RuntimeError: If not authenticated
+        """
+        return self._acquire_page()
+
+    def _person_scraper(self) -> PersonScraper:
+        """Return the session's person scraper, creating it on first use.
+
+        One scraper serves every call; each scrape runs on the page it's given.
+        """
+        if self._person_scraper_instance is None:
+            self._person_scraper_instance = PersonScraper(
+                self._ensure_authenticated(), cache_ttl=self._profile_cache_ttl
+            )
+        return self._person_scraper_instance
+
+    def _recycle_due(self) -> bool:
+        """Check if the context has served enough pages to be recycled."""
+        return 0 < self._recycle_every <= self._pages_served
+
+    async def _recycle_context(self) -> None:
+        """Swap the context for a fresh one that keeps the login."""
+        if self._browser_session is None:
+            return
+        self._context = await self._browser_session.recycle()
+        await self._route_resources(self._context)
+        # The login page and pooled pages were closed with the old context
+        self._page = await self._context.new_page()
+        self._page_pool = None
+        # Keep the scraper, and with it the profile cache, on the new context
+        if self._person_scraper_instance is not None:
+            self._person_scraper_instance.page = self._page
+        self._pages_served = 0
+
     async def get_profile(
         self, url: str, fields: PersonScrapingFields = PersonScrapingFields.MINIMAL
     ) -> Person:
@@ -100,11 +305,67 @@ class LinkedInSession:
         Raises:
             RuntimeError: If not authenticated
         """
-        from .scrapers.person import PersonScraper
+        async with self._acquire_page() as page:
+            return await self._person_scraper().scrape_profile(url, fields, page=page)
+
+    async def get_profiles(
+        self,
+        urls: List[str],
+        fields: PersonScrapingFields = PersonScrapingFields.MINIMAL,
+        concurrency: int = 4,
+    ) -> List[Person]:
+        """Get many LinkedIn profiles concurrently, reusing this session's login.
+
+        Args:
+            urls: LinkedIn profile URLs
+            fields: PersonScrapingFields enum specifying which fields to scrape
+            concurrency: Maximum number of profiles scraped at once
+
+        Returns:
+            Person objects in the same order as urls
+
+        Raises:
+            RuntimeError: If not authenticated
+        """
+        page: Page = self._ensure_authenticated()
+        return await PersonScraper.scrape_profiles(
+            page.context,
+            urls,
+            fields,
+            concurrency=concurrency,
+            page_source=self._acquire_page,
+            scraper=self._person_scraper(),
+        )
+
+    async def get_profiles_stream(
+        self,
+        urls: List[str],
+        fields: PersonScrapingFields = PersonScrapingFields.MINIMAL,
+        concurrency: int = 4,
+    ) -> AsyncIterator[tuple[str, Person]]:
+        """Get many LinkedIn profiles concurrently, yielding each as it finishes.
+
+        Args:
+            urls: LinkedIn profile URLs
+            fields: PersonScrapingFields enum specifying which fields to scrape
+            concurrency: Maximum number of profiles scraped at once
+
+        Yields:
+            (url, Person) pairs in completion order
 
+        Raises:
+            RuntimeError: If not authenticated
+        """
         page: Page = self._ensure_authenticated()
-        scraper: PersonScraper = PersonScraper(page)
-        return await scraper.scrape_profile(url, fields)
+        async for url, person in PersonScraper.scrape_profiles_as_completed(
+            page.context,
+            urls,
+            fields,
+            concurrency=concurrency,
+            page_source=self._acquire_page,
+            scraper=self._person_scraper(),
+        ):
+            yield str(url), person
 
     async def get_company(
         self,
@@ -125,11 +386,9 @@ class LinkedInSession:
         Raises:
             RuntimeError: If not authenticated
         """
-        from .scrapers.company import CompanyScraper
-
-        page: Page = self._ensure_authenticated()
-        scraper: CompanyScraper = CompanyScraper(page)
-        return await scraper.scrape_profile(url, fields, max_pages)
+        async with self._acquire_page() as page:
+            scraper: CompanyScraper = CompanyScraper(page)
+            return await scraper.scrape_profile(url, fields, max_pages)
 
     async def search_jobs(
         self, keywords: str, location: str = "", limit: int = 25
@@ -150,20 +409,39 @@ class LinkedInSession:
         raise NotImplementedError("Job search not yet implemented")
 
     async def close(self) -> None:
-        """Close LinkedIn session and clean up browser resources."""
-        self._authenticated = False
-        if self._browser_session:
-            await self._browser_session.__aexit__(None, None, None)
-            self._browser_session = None
+        """Close LinkedIn session and clean up browser resources.
+
+        Safe to call more than once or concurrently; only the first call tears
+        down the browser and later ones return immediately.
+        """
+        async with self._close_lock:
+            self._authenticated = False
+            # Detach first so a concurrent or repeated close finds nothing to exit
+            browser_session, self._browser_session = self._browser_session, None
+            if browser_session:
+                await browser_session.__aexit__(None, None, None)
         self._context = None
         self._page = None
+        self._page_pool = None
+        self._person_scraper_instance = None
 
     async def __aenter__(self):
         """Context manager entry - initialize browser and authenticate."""
         try:
-            self._browser_session = BrowserContextManager(headless=self._headless)
+            self._browser_session = BrowserContextManager(
+                headless=self._headless,
+                storage_state=self._restorable_storage_state(),
+                shared_browser=self._share_browser,
+                user_data_dir=self._persistent_profile,
+            )
             self._context = await self._browser_session.__aenter__()
-            self._page = await self._auth.login(context=self._context)
+            self._page = await self._restore_login() or await self._auth.login(
+                context=self._context
+            )
+            if self._storage_state_path:
+                # Save the logged-in state so the next session can skip the login
+                await self._context.storage_state(path=self._storage_state_path)
+            await self._route_resources(self._context)
             self._authenticated = True
             return self
         except Exception:
@@ -172,6 +450,64 @@ class LinkedInSession:
                 await self._browser_session.__aexit__(None, None, None)
             raise
 
+    async def _route_resources(self, context: BrowserContext) -> None:
+        """Skip downloading resources the scrapers don't need in a context.
+
+        Scrapers only read text and attributes (image alt/title attributes are
+        in the HTML), so image, media and font downloads are skipped once logged
+        in; login itself may need them for challenges. Routed once for the whole
+        context rather than per page, with URL filters so most requests never
+        reach a Python handler.
+        """
+        block_resources = self._block_resources
+        if block_resources is None:
+            block_resources = BLOCKED_RESOURCE_TYPES
+        for url, handler in resource_routes(block_resources):
+            await context.route(url, handler)
+
+    def _restorable_storage_state(self) -> Optional[str]:
+        """Return the saved storage state path if it should be restored.
+
+        Returns:
+            storage_state_path, or None if it isn't set, force_refresh was
+            requested, or the file is missing or older than storage_state_max_age
+        """
+        path = self._storage_state_path
+        if not path or self._force_refresh:
+            return None
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            # Not saved yet (e.g. first run)
+            return None
+        return path if age < self._storage_state_max_age else None
+
+    async def _restore_login(self) -> Optional[Page]:
+        """Return a logged-in page if the restored storage state is still valid.
+
+        Returns:
+            Page on the LinkedIn feed, or None if there was no saved state or it
+            has expired and a full login is needed
+        """
+        has_saved_login = self._storage_state_path or self._persistent_profile
+        if not has_saved_login or self._context is None:
+            return None
+        # Nothing was restored (e.g. first run), so there's no session to reuse
+        if not await self._context.cookies("https://www.linkedin.com"):
+            return None
+
+        page = await self._context.new_page()
+        try:
+            await page.goto(
+                "https://www.linkedin.com/feed/", wait_until="domcontentloaded"
+            )
+            if await self._auth.is_logged_in(page):
+                return page
+        except Exception:
+            pass
+        await page.close()
+        return None
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup resources."""
         await self.close()
@@ -30,51 +30,27 @@ async def test_company_scraping():
     output_dir = Path("tests/output")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Test 1: Minimal fields (fastest) with no employees
+    # Minimal fields (fastest) with no employees, all fields with 1 page of
+    # employees (~10) and all fields with 3 pages (~30)
+    runs = [
+        ("minimal", CompanyScrapingFields.MINIMAL, 0),
+        ("1page", CompanyScrapingFields.ALL, 1),
+        ("all", CompanyScrapingFields.ALL, 3),
+    ]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # One session for every run; each scrape gets its own page of the context
     async with LinkedInSession.from_cookie(cookie, headless=False) as session:
-        company = await session.get_company(
-            company_url,
-            fields=CompanyScrapingFields.MINIMAL,
-            max_pages=0,  # No employees
-        )
-
-        # Save to JSON
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = output_dir / f"company_minimal_{timestamp}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                company.model_dump(), f, indent=2, ensure_ascii=False, default=str
+        companies = await asyncio.gather(
+            *(
+                session.get_company(company_url, fields=fields, max_pages=max_pages)
+                for _, fields, max_pages in runs
             )
-
-        print(json.dumps(company.model_dump(), indent=2, default=str))
-
-    # Test 2: All fields with 1 page of employees
-    async with LinkedInSession.from_cookie(cookie, headless=False) as session:
-        company = await session.get_company(
-            company_url,
-            fields=CompanyScrapingFields.ALL,
-            max_pages=1,  # Default: 1 page of employees (~10 employees)
-        )
-
-        # Save to JSON
-        output_file = output_dir / f"company_1page_{timestamp}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                company.model_dump(), f, indent=2, ensure_ascii=False, default=str
-            )
-
-        print(json.dumps(company.model_dump(), indent=2, default=str))
-
-    # Test 3: All fields with 3 pages of employees
-    async with LinkedInSession.from_cookie(cookie, headless=False) as session:
-        company = await session.get_company(
-            company_url,
-            fields=CompanyScrapingFields.ALL,
-            max_pages=3,  # More employees (~30)
         )
 
+    for (name, _, _), company in zip(runs, companies):
         # Save to JSON
-        output_file = output_dir / f"company_all_{timestamp}.json"
+        output_file = output_dir / f"company_{name}_{timestamp}.json"
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(
                 company.model_dump(), f, indent=2, ensure_ascii=False, default=str
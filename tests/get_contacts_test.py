@@ -7,16 +7,19 @@ and writes the resulting `Person` model to JSON under `tests/output/`.
 """
 
 import asyncio
-import json
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
-from pydantic import HttpUrl
+from pydantic import HttpUrl, TypeAdapter
 
 from fast_linkedin_scraper import LinkedInSession
+from fast_linkedin_scraper._pool import run_worker_pool
 from fast_linkedin_scraper.models import Person
 from fast_linkedin_scraper.scrapers.person.contacts import scrape_contacts
 
+from output_files import pick_filename
+
 load_dotenv()
 
 # Ensure LI_AT_COOKIE is set in environment
@@ -32,45 +35,47 @@ USERNAMES = [
 # Output directory relative to tests/
 OUTPUT_DIR = "output"
 
+# Serializes Person models straight to UTF-8 JSON bytes
+PERSON_ADAPTER = TypeAdapter(Person)
+
 
 async def main():
     assert cookie is not None  # Type narrowing for type checker
     async with LinkedInSession.from_cookie(cookie, headless=False) as session:
-        # Get authenticated Playwright page
-        page = session._ensure_authenticated()
+        # Ensure the output directory exists and list its files once, so
+        # picking a free file name needs no filesystem checks
+        tests_output_dir = os.path.join("tests", OUTPUT_DIR)
+        os.makedirs(tests_output_dir, exist_ok=True)
+        taken = set(os.listdir(tests_output_dir))
 
-        for username in USERNAMES:
+        async def scrape_and_save(username: str) -> None:
             profile_url = f"https://www.linkedin.com/in/{username}/"
 
             # Initialize Person with validated LinkedIn URL
             person: Person = Person(linkedin_url=HttpUrl(profile_url))
 
-            # Run only the contacts scraping logic
-            await scrape_contacts(page, person)
+            # Run only the contacts scraping logic, on a page of the session's pool
+            async with session.borrow_page() as page:
+                await scrape_contacts(page, person)
 
             # Prepare output path (auto-increment if file exists)
-            tests_output_dir = os.path.join("tests", OUTPUT_DIR)
-            os.makedirs(tests_output_dir, exist_ok=True)
+            name = pick_filename(f"{username}_contacts", taken)
+            filename = os.path.join(tests_output_dir, name)
 
-            base_filename = f"{username}_contacts"
-            extension = ".json"
-            filename = os.path.join(tests_output_dir, f"{base_filename}{extension}")
-
-            counter = 1
-            while os.path.exists(filename):
-                filename = os.path.join(
-                    tests_output_dir, f"{base_filename}_{counter}{extension}"
-                )
-                counter += 1
+            # Serialize once with pydantic's native JSON encoder
+            person_json = PERSON_ADAPTER.dump_json(person, indent=2)
 
             # Print the person object as pretty JSON
-            print(json.dumps(person.model_dump(), indent=2, default=str))
+            print(person_json.decode())
+
+            # Write Person model to JSON off the event loop
+            await asyncio.to_thread(Path(filename).write_bytes, person_json)
 
-            # Write Person model to JSON
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(
-                    person.model_dump(), f, indent=2, default=str, ensure_ascii=False
-                )
+        # Scrape the profiles concurrently, each saved as soon as it's done
+        results = await run_worker_pool(USERNAMES, scrape_and_save)
+        for username, result in results.items():
+            if isinstance(result, Exception):
+                print(f"Failed to scrape contacts of {username}: {result}")
 
 
 if __name__ == "__main__":
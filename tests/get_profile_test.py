@@ -2,14 +2,18 @@
 """Example: Profile scraping with cookie authentication"""
 
 import asyncio
-import json
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
 
 from fast_linkedin_scraper import LinkedInSession, PersonScrapingFields
+from fast_linkedin_scraper._pool import run_worker_pool
 from fast_linkedin_scraper.models import Person
 
+from output_files import pick_filename
+
 load_dotenv()
 # Make sure to set LI_AT_COOKIE in your environment
 cookie = os.getenv("LI_AT_COOKIE")
@@ -23,43 +27,40 @@ USERNAMES = [
 # Create output directory
 output_dir = "output"
 
+# Serializes Person models straight to UTF-8 JSON bytes
+person_adapter = TypeAdapter(Person)
+
 
 async def main():
     assert cookie is not None  # Type narrowing for type checker
     async with LinkedInSession.from_cookie(cookie, headless=False) as session:
-        # Scrape both profiles with all fields for comprehensive testing
-        for username in USERNAMES:
-            profile_url = f"https://www.linkedin.com/in/{username}/"
-            person: Person = await session.get_profile(
-                profile_url, fields=PersonScrapingFields.ALL
+        # Ensure tests/output directory exists and list it once
+        tests_output_dir = os.path.join("tests", output_dir)
+        os.makedirs(tests_output_dir, exist_ok=True)
+        taken = set(os.listdir(tests_output_dir))
+
+        async def scrape_and_save(username: str) -> None:
+            # Scrape with all fields for comprehensive testing
+            person = await session.get_profile(
+                f"https://www.linkedin.com/in/{username}/",
+                fields=PersonScrapingFields.ALL,
             )
+            # Serialize once with pydantic's native JSON encoder for printing and saving
+            person_json = person_adapter.dump_json(person, indent=2)
 
             # Print the person object as pretty JSON
-            print(json.dumps(person.model_dump(), indent=2, default=str))
-
-            # Save the person object to a JSON file with auto-incrementing filename
-            # Extract username from URL (e.g., "anistji" from "https://www.linkedin.com/in/anistji/")
-            username = profile_url.split("/in/")[1].rstrip("/")
-            base_filename = username
-            extension = ".json"
-
-            # Ensure tests/output directory exists
-            tests_output_dir = os.path.join("tests", output_dir)
-            os.makedirs(tests_output_dir, exist_ok=True)
-
-            filename = os.path.join(tests_output_dir, f"{base_filename}{extension}")
+            print(person_json.decode())
 
-            counter = 1
-            while os.path.exists(filename):
-                filename = os.path.join(
-                    tests_output_dir, f"{base_filename}_{counter}{extension}"
-                )
-                counter += 1
+            # Save with an auto-incrementing filename, writing off the event loop
+            # so the other workers keep scraping
+            path = Path("tests") / output_dir / pick_filename(username, taken)
+            await asyncio.to_thread(path.write_bytes, person_json)
 
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(
-                    person.model_dump(), f, indent=2, default=str, ensure_ascii=False
-                )
+        # Scrape the profiles concurrently, each saved as soon as it's done
+        results = await run_worker_pool(USERNAMES, scrape_and_save)
+        for username, result in results.items():
+            if isinstance(result, Exception):
+                print(f"Failed to scrape {username}: {result}")
 
 
 if __name__ == "__main__":
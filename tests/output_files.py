@@ -0,0 +1,19 @@
+"""Helpers shared by the test scripts for writing results to tests/output."""
+
+
+def pick_filename(base_filename: str, taken: set[str]) -> str:
+    """Return a free JSON file name for base_filename in tests/output.
+
+    taken holds the file names already in tests/output, listed once up front,
+    so picking a free name needs no filesystem checks. Call it on the event
+    loop only, so concurrent scrapes never pick the same name.
+    """
+    extension = ".json"
+
+    name = f"{base_filename}{extension}"
+    counter = 1
+    while name in taken:
+        name = f"{base_filename}_{counter}{extension}"
+        counter += 1
+    taken.add(name)
+    return name